@@ -9,6 +9,16 @@ import subprocess
 import os
 
 
+# Coverage settings for full runs
+COVERAGE_ARGS = [
+    "--cov=.",
+    "--cov-report=html:htmlcov",
+    "--cov-report=term-missing",
+    "--cov-report=xml",
+    "--cov-fail-under=30",  # Set to current coverage level, can increase later
+]
+
+
 def run_command(cmd):
     """Run a command and return the result."""
     print(f"Running: {' '.join(cmd)}")
@@ -39,13 +49,19 @@ Commands:
     unit        - Run only unit tests
     integration - Run only integration tests  
     fast        - Run tests excluding slow ones
-    coverage    - Run tests and generate coverage report
+    test-fast   - Run test files without coverage or async plugins (default: test_equipment.py)
+    parallel    - Run tests across all CPU cores (optional test files)
+    failed      - Re-run last failures first, or everything if none failed
+    coverage    - Run all tests and generate coverage report (enforces threshold)
     specific    - Run specific test file (requires filename)
     
 Examples:
     python run_tests.py all
     python run_tests.py unit
     python run_tests.py specific test_player.py
+    python run_tests.py parallel test_combat.py test_debug.py
+    python run_tests.py failed test_equipment.py
+    python run_tests.py test-fast test_equipment.py
         """)
         return
     
@@ -55,7 +71,7 @@ Examples:
     base_cmd = ["python", "-m", "pytest"]
     
     if command == "all":
-        cmd = base_cmd + ["-v"]
+        cmd = base_cmd + COVERAGE_ARGS + ["-v"]
         
     elif command == "unit":
         cmd = base_cmd + ["-m", "unit", "-v"]
@@ -66,8 +82,24 @@ Examples:
     elif command == "fast":
         cmd = base_cmd + ["-m", "not slow", "-v"]
         
+    elif command == "test-fast":
+        # Dev inner loop: skip coverage instrumentation and unused plugins
+        test_files = [f"tests/{name}" for name in sys.argv[2:]] or ["tests/test_equipment.py"]
+        cmd = base_cmd + ["--no-cov", "-p", "no:asyncio", "-p", "no:anyio"] + test_files
+        
+    elif command == "parallel":
+        # Needs pytest-xdist (see requirements-dev.txt); loadfile keeps each
+        # file on one worker so module-scoped fixtures are built once
+        test_files = [f"tests/{name}" for name in sys.argv[2:]]
+        cmd = base_cmd + ["-n", "auto", "--dist", "loadfile"] + test_files + ["-v"]
+        
+    elif command == "failed":
+        # Uses pytest's .pytest_cache from the previous run
+        test_files = [f"tests/{name}" for name in sys.argv[2:]]
+        cmd = base_cmd + ["--lf", "--ff"] + test_files + ["-v"]
+        
     elif command == "coverage":
-        cmd = base_cmd + ["--cov=.", "--cov-report=html", "--cov-report=term", "-v"]
+        cmd = base_cmd + COVERAGE_ARGS + ["-v"]
         
     elif command == "specific":
         if len(sys.argv) < 3:
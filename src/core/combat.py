@@ -11,9 +11,15 @@ from src.ui.display import display
 class Combat:
     """Manages combat encounters with scrolling text display."""
     
-    def __init__(self):
-        """Initialize the combat system."""
-        pass
+    def __init__(self, rng=None):
+        """
+        Initialize the combat system.
+        
+        Args:
+            rng: Random number source with random() and randint(), such as a
+                seeded random.Random (default: the global random module)
+        """
+        self.rng = rng if rng is not None else random
     
     def calculate_damage(self, base_damage):
         """
@@ -27,8 +33,8 @@ class Combat:
         """
         # Add some randomness: 80% to 120% of base damage
         min_damage = max(1, int(base_damage * 0.8))
-        max_damage = int(base_damage * 1.2)
-        return random.randint(min_damage, max_damage)
+        max_damage = max(min_damage, int(base_damage * 1.2))
+        return self.rng.randint(min_damage, max_damage)
     
     def take_damage(self, current_health, damage):
         """
@@ -41,7 +47,8 @@ class Combat:
         Returns:
             tuple: (new_health, is_alive)
         """
-        new_health = max(0, current_health - damage)
+        # Negative damage is ignored rather than healing
+        new_health = max(0, current_health - max(0, damage))
         is_alive = new_health > 0
         return new_health, is_alive
     
@@ -55,7 +62,7 @@ class Combat:
         Returns:
             str: "fled" if successful, "failed" if unsuccessful
         """
-        if random.random() < success_chance:
+        if self.rng.random() < success_chance:
             return "fled"
         return "failed"
     
@@ -71,7 +78,7 @@ class Combat:
         Returns:
             tuple: (damage_amount, is_critical)
         """
-        is_critical = random.random() < crit_chance
+        is_critical = self.rng.random() < crit_chance
         
         if is_critical:
             damage = int(base_damage * crit_multiplier)
@@ -134,6 +141,36 @@ class Combat:
         
         return None
 
+    def calculate_experience_reward(self, player, monster):
+        """
+        Calculate the experience a player earns for defeating a monster.
+        
+        Args:
+            player: The player object
+            monster: The defeated monster
+            
+        Returns:
+            int: Experience points to award (at least 1)
+        """
+        # Calculate XP reward based on monster level relative to player level
+        # Higher level monsters give more XP, lower level give less
+        level_difference = monster.level - player.level
+        base_xp = monster.level * 20  # Base XP per monster level
+        
+        # Scale XP based on level difference to encourage appropriate challenges
+        if level_difference >= 2:
+            xp_multiplier = 1.5  # 50% bonus for challenging monsters
+        elif level_difference >= 0:
+            xp_multiplier = 1.0  # Normal XP for equal/slightly higher level
+        elif level_difference >= -2:
+            xp_multiplier = 0.7  # Reduced XP for lower level monsters
+        else:
+            xp_multiplier = 0.3  # Very little XP for much lower level monsters
+        
+        base_xp = int(base_xp * xp_multiplier)
+        xp_bonus = self.rng.randint(0, 5)  # Small random bonus
+        return max(1, base_xp + xp_bonus)  # Minimum 1 XP
+    
     def run_combat(self, player, monster):
         """
         Handle full combat between player and monster with scrolling display.
@@ -189,24 +226,7 @@ class Combat:
                         display.add_line(threshold_message, delay=0.6)
                 
                 if not monster.is_alive:
-                    # Calculate XP reward based on monster level relative to player level
-                    # Higher level monsters give more XP, lower level give less
-                    level_difference = monster.level - player.level
-                    base_xp = monster.level * 20  # Base XP per monster level
-                    
-                    # Scale XP based on level difference to encourage appropriate challenges
-                    if level_difference >= 2:
-                        xp_multiplier = 1.5  # 50% bonus for challenging monsters
-                    elif level_difference >= 0:
-                        xp_multiplier = 1.0  # Normal XP for equal/slightly higher level
-                    elif level_difference >= -2:
-                        xp_multiplier = 0.7  # Reduced XP for lower level monsters
-                    else:
-                        xp_multiplier = 0.3  # Very little XP for much lower level monsters
-                    
-                    base_xp = int(base_xp * xp_multiplier)
-                    xp_bonus = random.randint(0, 5)  # Small random bonus
-                    total_xp = max(1, base_xp + xp_bonus)  # Minimum 1 XP
+                    total_xp = self.calculate_experience_reward(player, monster)
                     
                     display.add_line("", delay=0.4)
                     display.add_line(f"🎉 Victory! You defeated the {monster.name}!", delay=0.6)
@@ -234,7 +254,7 @@ class Combat:
                     display.add_line("", delay=0.3)
                     display.add_line(f"💚 {player.emoji} {player.name} is already at full health!", delay=0)
                 else:
-                    heal_amount = random.randint(10, 15)
+                    heal_amount = self.rng.randint(10, 15)
                     actual_healed = player.heal(heal_amount)
                     display.add_line("", delay=0.3)
                     display.add_line(f"💚 {player.emoji} {player.name} heals for {actual_healed} HP!", delay=0.8)
@@ -20,9 +20,13 @@ class GameDatabase:
         if self.is_monsters_table_empty():
             self.populate_initial_monsters()
     
+    def _connect(self):
+        """Open a connection to the database (db_path may be a "file:" URI)."""
+        return sqlite3.connect(self.db_path, uri=str(self.db_path).startswith("file:"))
+    
     def init_database(self):
         """Create all necessary tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Players table - save character data
@@ -86,7 +90,7 @@ class GameDatabase:
     
     def migrate_database(self):
         """Handle database schema migrations for existing databases."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -122,7 +126,7 @@ class GameDatabase:
     
     def is_monsters_table_empty(self):
         """Check if monster_templates table has any data."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT COUNT(*) FROM monster_templates')
@@ -149,7 +153,7 @@ class GameDatabase:
             ("Lich King", 9, 10, 120, 16, "👑", "legendary", "An undead sorcerer of unimaginable magical power")
         ]
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.executemany('''
@@ -165,7 +169,7 @@ class GameDatabase:
     # Player save/load methods
     def save_player(self, player):
         """Save player to database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         now = datetime.now().isoformat()
@@ -195,7 +199,7 @@ class GameDatabase:
     
     def load_player(self, name):
         """Load player from database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM players WHERE name = ?', (name,))
@@ -222,7 +226,7 @@ class GameDatabase:
     
     def get_all_saves(self):
         """Get list of all saved characters."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -238,7 +242,7 @@ class GameDatabase:
     # Monster database methods
     def get_monsters_for_level(self, player_level):
         """Get all monsters appropriate for player's level."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -280,7 +284,7 @@ class GameDatabase:
     def add_monster_template(self, name, min_level, max_level, base_health, 
                            base_strength, emoji, rarity='common', description=''):
         """Add a new monster template to the database."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -295,7 +299,7 @@ class GameDatabase:
     # Statistics methods
     def update_battle_stats(self, player_name, won=False, damage_dealt=0, fled=False):
         """Update battle statistics."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         if won:
@@ -326,7 +330,7 @@ class GameDatabase:
     
     def get_player_stats(self, player_name):
         """Get player statistics."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM player_stats WHERE player_name = ?', (player_name,))
@@ -355,7 +359,7 @@ class GameDatabase:
     # Settings methods
     def get_player_settings(self, player_name):
         """Get player settings."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT * FROM player_settings WHERE player_name = ?', (player_name,))
@@ -378,7 +382,7 @@ class GameDatabase:
     
     def update_player_settings(self, player_name, settings):
         """Update player settings."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -395,7 +399,7 @@ class GameDatabase:
     
     def get_player_unlocked_areas(self, player_name):
         """Get list of unlocked areas for a player."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('SELECT unlocked_areas FROM players WHERE name = ?', (player_name,))
@@ -409,7 +413,7 @@ class GameDatabase:
     
     def unlock_area_for_player(self, player_name, area_key):
         """Unlock a new area for a player."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get current unlocked areas
@@ -434,7 +438,7 @@ class GameDatabase:
     
     def delete_player(self, player_name):
         """Delete a player and all associated data."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Delete from all related tables
@@ -447,7 +451,7 @@ class GameDatabase:
     
     def update_player_stat(self, player_name, stat_name, increment=1):
         """Update a specific player statistic."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Ensure the player has a stats record
@@ -111,11 +111,13 @@ class Player:
     
     def display_stats(self):
         """Display the player's full stats."""
-        print(f"📊 {self.name} Stats:")
-        print(f"   Level: {self.level}")
-        print(f"   Health: {self.current_health}/{self.max_health}")
-        print(f"   Strength: {self.strength}")
-        print(f"   Status: {self.get_health_status()}")
+        print("\n".join([
+            f"📊 {self.name} Stats:",
+            f"   Level: {self.level}",
+            f"   Health: {self.current_health}/{self.max_health}",
+            f"   Strength: {self.strength}",
+            f"   Status: {self.get_health_status()}",
+        ]))
     
     def heal(self, amount):
         """
@@ -160,10 +160,12 @@ class Monster:
     
     def display_stats(self):
         """Display the monster's full stats."""
-        print(f"📊 {self.name} Stats:")
-        print(f"   Level: {self.level}")
-        print(f"   Health: {self.current_health}/{self.max_health}")
-        print(f"   Status: {self.get_health_status()}")
+        print("\n".join([
+            f"📊 {self.name} Stats:",
+            f"   Level: {self.level}",
+            f"   Health: {self.current_health}/{self.max_health}",
+            f"   Status: {self.get_health_status()}",
+        ]))
     
     def __str__(self):
         """String representation of the monster."""
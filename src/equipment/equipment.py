@@ -48,8 +48,24 @@ class Equipment:
         self.health_bonus = health_bonus
         self.defense_bonus = defense_bonus
         
+        # Last summary string and the stats it was built from
+        self._summary = None
+        self._summary_key = None
+        
+    def _stat_key(self):
+        """Get the stats the summary is built from."""
+        return (self.strength_bonus, self.health_bonus, self.defense_bonus)
+    
     def get_stat_summary(self):
-        """Get a formatted string of all stat bonuses."""
+        """Get a formatted string of all stat bonuses, rebuilt only when they change."""
+        key = self._stat_key()
+        if key != self._summary_key:
+            self._summary = self._format_stat_summary()
+            self._summary_key = key
+        return self._summary
+    
+    def _format_stat_summary(self):
+        """Format all stat bonuses into a summary string."""
         bonuses = []
         if self.strength_bonus != 0:
             bonuses.append(f"STR: {self.strength_bonus:+d}")
@@ -98,9 +114,13 @@ class Weapon(Equipment):
         else:
             raise ValueError("Weapons can only be equipped in main_hand or off_hand")
     
-    def get_stat_summary(self):
-        """Get weapon-specific stat summary."""
-        base_stats = super().get_stat_summary()
+    def _stat_key(self):
+        """Get the stats the summary is built from, including damage."""
+        return super()._stat_key() + (self.damage,)
+    
+    def _format_stat_summary(self):
+        """Format the weapon-specific stat summary."""
+        base_stats = super()._format_stat_summary()
         weapon_stats = f"DMG: +{self.damage}"
         
         if base_stats != "No stat bonuses":
@@ -19,13 +19,16 @@ class Inn:
         Args:
             player: The player object
         """
-        print("\n" + "=" * 50)
-        print("🏠 Welcome to the Cozy Dragon Inn!")
-        print("=" * 50)
-        print("The warm fireplace crackles as adventurers share")
-        print("tales of their journeys. The innkeeper nods")
-        print("welcomingly as you approach the bar.")
-        print()
+        # One print for the whole banner instead of a write per line
+        print("\n".join([
+            "\n" + "=" * 50,
+            "🏠 Welcome to the Cozy Dragon Inn!",
+            "=" * 50,
+            "The warm fireplace crackles as adventurers share",
+            "tales of their journeys. The innkeeper nods",
+            "welcomingly as you approach the bar.",
+            "",
+        ]))
         
         player.display_status()
     
@@ -3,10 +3,135 @@
 Handles scrolling text window with static header/footer 
 """
 
+import io
 import os
+import select
+import shutil
 import sys
 import time
-from cgitb import text
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Monster health bands as (percent ceiling, icon), checked from lowest to highest
+_HP_BANDS = (
+    (10, "💀"),   # Near death
+    (25, "⚠️"),   # Badly injured
+    (50, "💔"),   # Wounded
+    (75, "🩸"),   # Slightly injured
+)
+_HP_HEALTHY_ICON = "💚"
+
+# Rows around the content area: header (3), footer (3) and the input line
+_FRAME_CHROME_ROWS = 7
+# Terminal size to assume when it can't be detected (gives 20 content rows)
+_FALLBACK_TERMINAL_SIZE = (80, 20 + _FRAME_CHROME_ROWS)
+
+# ANSI escape: clear the whole screen and move the cursor to the top left
+_CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Footer option prefixes, indexed by option number ("1) " at index 1)
+_OPTION_PREFIXES = tuple(f"{i}) " for i in range(32))
+
+
+@lru_cache(maxsize=32)
+def _build_options_text(options):
+    """
+    Build the footer prompt for a menu, shortening each option.
+    
+    Menus are reopened with the same options over and over (inn, combat),
+    so the result is cached on the options tuple.
+    
+    Args:
+        options (tuple): Menu option strings
+        
+    Returns:
+        str: Footer text such as "1) 🛏️ Rest | 2) 📊 Stats: "
+    """
+    short_options = []
+    for i, option in enumerate(options, 1):
+        # Numbered prefix such as "1) ", prebuilt for all but very long menus
+        prefix = _OPTION_PREFIXES[i] if i < len(_OPTION_PREFIXES) else f"{i}) "
+        # Extract key words from option for shorter footer display
+        if "Rest" in option:
+            short_options.append(prefix + "🛏️ Rest")
+        elif "adventure" in option.lower():
+            short_options.append(prefix + "🗺️ Adventure")
+        elif any(location in option for location in ["Forest", "Cave", "Desert", "Mountain", "Dungeon"]):
+            # Extract the emoji and location name from the full option text
+            # This handles dynamic location names without hardcoding
+            if "🌲" in option:  # Forest
+                short_options.append(prefix + "🌲 Forest")
+            elif "🕳️" in option:  # Cave
+                short_options.append(prefix + "🕳️ Cave")
+            elif "🏜️" in option:  # Desert  
+                short_options.append(prefix + "🏜️ Desert")
+            elif "⛰️" in option:  # Mountain
+                short_options.append(prefix + "⛰️ Mountain")
+            elif "🏰" in option:  # Dungeon
+                short_options.append(prefix + "🏰 Dungeon")
+            else:
+                # Fallback: try to extract emoji and first word after it
+                parts = option.split()
+                if len(parts) >= 2:
+                    emoji = parts[0]
+                    location = parts[1]
+                    short_options.append(prefix + f"{emoji} {location}")
+                else:
+                    short_options.append(prefix + option)
+        elif "stats" in option:
+            short_options.append(prefix + "📊 Stats")
+        elif "Save game" in option:
+            short_options.append(prefix + "💾 Save")
+        elif "Settings" in option:
+            short_options.append(prefix + "⚙️ Settings")
+        elif "Quit" in option:
+            short_options.append(prefix + "🚪 Quit")
+        elif "Continue exploring" in option:
+            short_options.append(prefix + "🌲 Continue")
+        elif "Return to" in option:
+            short_options.append(prefix + "🏠 Return")
+        else:
+            # Fallback to first few words
+            words = option.split()[:3]
+            short_options.append(prefix + ' '.join(words))
+    
+    return " | ".join(short_options) + ": "
+
+
+@lru_cache(maxsize=32)
+def _valid_menu_choices(option_count):
+    """
+    Get the inputs a menu accepts: the option numbers plus "quit".
+    
+    Args:
+        option_count (int): Number of menu options
+        
+    Returns:
+        frozenset: Accepted choice strings
+    """
+    return frozenset(map(str, range(1, option_count + 1))) | {"quit"}
+
+
+# Inputs accepted by the combat prompt (attack, heal, flee)
+_COMBAT_CHOICES = frozenset({"1", "2", "3"})
+
+
+@lru_cache(maxsize=128)
+def _build_menu_lines(status):
+    """
+    Split a menu's status text into the lines shown above the prompt.
+    
+    Cached on the status text, so reopening a menu with unchanged status
+    (or redrawing it after invalid input) reuses the same lines.
+    
+    Args:
+        status (str): Status/intro text, possibly spanning several lines
+        
+    Returns:
+        tuple: Status lines
+    """
+    return tuple(status.split('\n'))
 
 
 def set_monster_for_header(self, monster):
@@ -28,47 +153,228 @@ def set_header(self, text):
 class Display:
     """Manages scrolling text window with static elements."""
     
-    def __init__(self, scroll_delay=0.03, line_delay=0.5, window_height=20):
+    # Fixed attribute layout for the attributes read on every line and
+    # refresh. __dict__ stays so tests can patch methods on an instance.
+    __slots__ = (
+        'scroll_delay', 'ui_width', 'window_height', 'content_lines',
+        'header_text', 'player', 'monster', '_footer_text', '_footer_bytes',
+        '_line_delay', '_exposition_line_delay', '_debug_delay', '_debug_mode',
+        '_active_line_delay', '_active_exposition_delay',
+        '_stdout_fd', '_stdout_encoding', '_stdin_fd', '_ansi_clear',
+        '_blank_content_line', '_blank_line_bytes', '_clear_bytes',
+        '_content_bytes', '_content_dirty', '_suspend_refresh',
+        '_show_hp_in_header', '_hp_icon_cache', '_hdr_cache_key', '_hdr_cache_val',
+        '_title_len', '_title_pads',
+        '__dict__',
+    )
+    
+    def __init__(self, scroll_delay=0.03, line_delay=0.5, window_height=None):
         """
         Initialize display system.
         
         Args:
             scroll_delay (float): Not used anymore (kept for compatibility)
             line_delay (float): Delay between lines (seconds)
-            window_height (int): Number of lines in the scrolling content area
+            window_height (int, optional): Number of lines in the scrolling
+                content area. Defaults to whatever fits the terminal.
         """
+        if window_height is None:
+            rows = shutil.get_terminal_size(_FALLBACK_TERMINAL_SIZE).lines
+            window_height = max(1, rows - _FRAME_CHROME_ROWS)
         self.scroll_delay = scroll_delay
-        self.line_delay = 0.3  # Regular line delay
-        self.exposition_line_delay = 0.6  # Slower for exposition text
-        self.debug_mode = False  # Debug mode for fast testing
-        self.debug_delay = 0.05  # Very fast delay for debug mode
+        self._line_delay = 0.3  # Regular line delay
+        self._exposition_line_delay = 0.6  # Slower for exposition text
+        self._debug_delay = 0.05  # Very fast delay for debug mode
+        self._debug_mode = False  # Debug mode for fast testing
+        self._resolve_delays()
         self.ui_width = 80
+        self._blank_content_line = " " * (self.ui_width - 2)
+        self._stdout_fd, self._stdout_encoding = self._get_stdout_target()
+        self._stdin_fd = self._get_stdin_tty()
+        # Static frame pieces, encoded once so refreshes only encode dynamic text
+        self._blank_line_bytes = self._encode(self._blank_content_line + "\n")
+        self._clear_bytes = self._encode(_CLEAR_SCREEN)
+        # Clear with an escape sequence unless the Windows console can't handle it
+        self._ansi_clear = os.name != 'nt' or self._enable_vt_mode()
         self.window_height = window_height
-        self.content_lines = [""] * window_height  # Initialize with empty lines
+        # Bounded deque: appending evicts the oldest line without shifting the rest
+        self.content_lines = deque([""] * window_height, maxlen=window_height)
+        # Encoded content area, rebuilt only after the lines change
+        self._content_bytes = b""
+        self._content_dirty = True
         self.header_text = "PythonDungeon"
         self.footer_text = ""
         
         # HP tracking for dynamic headers
         self.player = None
         self.monster = None
-        self.show_hp_in_header = False
+        self._show_hp_in_header = False
+        self._hp_icon_cache = (None, None, "")  # (current_health, max_health, icon)
+        self._suspend_refresh = False  # Set while inside batch()
+        self._hdr_cache_key = None
+        self._hdr_cache_val = ""
+        self._title_len = None
+        self._title_pads = ("", "")  # ("=" padding left, right) for _title_len
+    
+    def _get_stdout_target(self):
+        """
+        Look up the real stdout file descriptor and encoding.
+        
+        Returns:
+            tuple: (fd, encoding), with fd None if stdout has no descriptor
+        """
+        stdout = sys.__stdout__
+        try:
+            return stdout.fileno(), stdout.encoding or "utf-8"
+        except (AttributeError, OSError, ValueError):
+            return None, "utf-8"
+    
+    def _get_stdin_tty(self):
+        """
+        Look up the stdin descriptor if pauses can watch it for typed input.
+        
+        Returns:
+            int: The descriptor, or None when stdin isn't a terminal or
+                select() can't wait on it (Windows consoles)
+        """
+        if os.name == 'nt':
+            return None
+        stdin = sys.__stdin__
+        try:
+            return stdin.fileno() if stdin.isatty() else None
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def _pause(self, seconds):
+        """
+        Wait between lines, ending early once the player has typed ahead.
+        
+        Typed input stays queued for the next prompt, so the remaining
+        pauses before that prompt are skipped too and the text catches up.
+        
+        Args:
+            seconds (float): Longest time to wait
+        """
+        if self._stdin_fd is not None:
+            try:
+                select.select([self._stdin_fd], [], [], seconds)
+                return
+            except (OSError, ValueError):
+                pass
+        time.sleep(seconds)
+    
+    def _enable_vt_mode(self):
+        """
+        Turn on ANSI escape handling in the Windows console.
+        
+        Returns:
+            bool: True if the console will honor escape sequences
+        """
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+        except (AttributeError, ImportError, OSError):
+            return False
     
     def clear_screen(self):
         """Clear the terminal screen."""
-        # Windows
-        if os.name == 'nt':
-            os.system('cls')
-        # Unix/Linux/MacOS
+        if self._ansi_clear:
+            self._write_frame(self._clear_bytes)
         else:
-            os.system('clear')
+            # Older Windows consoles without escape sequence support
+            os.system('cls')
     
     def set_header(self, text):
         """Set the header text."""
         self.header_text = text
     
     def set_footer(self, text):
-        """Set the footer text."""
-        self.footer_text = text
+        """Set the footer text (None clears it)."""
+        self.footer_text = text if text is not None else ""
+    
+    @property
+    def footer_text(self):
+        """Text shown centered in the footer bar."""
+        return self._footer_text
+    
+    @footer_text.setter
+    def footer_text(self, text):
+        self._footer_text = text
+        # Render and encode the footer bars now rather than on every refresh
+        self._footer_bytes = self._encode(self._render_footer())
+    
+    @property
+    def debug_mode(self):
+        """Whether debug mode's fast delays are in effect."""
+        return self._debug_mode
+    
+    @debug_mode.setter
+    def debug_mode(self, enabled):
+        self._debug_mode = bool(enabled)
+        self._resolve_delays()
+    
+    @property
+    def line_delay(self):
+        """Delay between regular lines outside debug mode."""
+        return self._line_delay
+    
+    @line_delay.setter
+    def line_delay(self, seconds):
+        self._line_delay = seconds
+        self._resolve_delays()
+    
+    @property
+    def exposition_line_delay(self):
+        """Delay between exposition lines outside debug mode."""
+        return self._exposition_line_delay
+    
+    @exposition_line_delay.setter
+    def exposition_line_delay(self, seconds):
+        self._exposition_line_delay = seconds
+        self._resolve_delays()
+    
+    @property
+    def debug_delay(self):
+        """Delay used for every line in debug mode."""
+        return self._debug_delay
+    
+    @debug_delay.setter
+    def debug_delay(self, seconds):
+        self._debug_delay = seconds
+        self._resolve_delays()
+    
+    def _resolve_delays(self):
+        """Work out the active delays whenever the mode or a delay changes."""
+        # Resolve the active delays here instead of on every line
+        if self._debug_mode:
+            self._active_line_delay = self._debug_delay
+            self._active_exposition_delay = self._debug_delay
+        else:
+            self._active_line_delay = self._line_delay
+            self._active_exposition_delay = self._exposition_line_delay
+    
+    def get_line_delay(self):
+        """Get the delay between regular lines for the current mode."""
+        return self._active_line_delay
+    
+    def get_exposition_delay(self):
+        """Get the delay between exposition lines for the current mode."""
+        return self._active_exposition_delay
+    
+    @property
+    def show_hp_in_header(self):
+        """Whether the header shows HP; always False when no player is set."""
+        return self._show_hp_in_header and self.player is not None
+    
+    @show_hp_in_header.setter
+    def show_hp_in_header(self, value):
+        self._show_hp_in_header = value
     
     def set_player_for_header(self, player):
         """Set the player for HP display in header."""
@@ -87,9 +393,22 @@ class Display:
     
     def get_dynamic_header(self):
         """Get header with dynamic HP information if enabled."""
-        if not self.show_hp_in_header or not self.player:
+        if not self.show_hp_in_header:
             return self.header_text
         
+        # Reuse the last header if nothing shown in it has changed
+        player, monster = self.player, self.monster
+        cache_key = (
+            self.header_text,
+            player.emoji, player.name, player.current_health, player.max_health,
+            id(monster),
+            getattr(monster, "name", None),
+            getattr(monster, "current_health", None),
+            getattr(monster, "max_health", None),
+        )
+        if cache_key == self._hdr_cache_key:
+            return self._hdr_cache_val
+        
         # Start with base header and player HP
         header_parts = []
         if self.header_text:
@@ -103,7 +422,9 @@ class Display:
             health_icon = self.get_health_threshold_icon(self.monster)
             header_parts.append(f"🐉 {self.monster.name} {health_icon}")
         
-        return " | ".join(header_parts)
+        self._hdr_cache_key = cache_key
+        self._hdr_cache_val = " | ".join(header_parts)
+        return self._hdr_cache_val
     
     def get_health_threshold_icon(self, monster):
         """
@@ -118,107 +439,227 @@ class Display:
         if not monster:
             return ""
         
-        health_percent = (monster.current_health / monster.max_health) * 100
-        
-        if health_percent <= 10:
-            return "💀"  # Near death
-        elif health_percent <= 25:
-            return "⚠️"   # Badly injured
-        elif health_percent <= 50:
-            return "💔"  # Wounded
-        elif health_percent <= 75:
-            return "🩸"  # Slightly injured
-        else:
-            return "💚"  # Healthy
+        current, maximum = monster.current_health, monster.max_health
+        cached_current, cached_max, cached_icon = self._hp_icon_cache
+        if current == cached_current and maximum == cached_max:
+            return cached_icon
+        
+        # Compare current*100 against percent*max to avoid float division
+        scaled_health = current * 100
+        icon = _HP_HEALTHY_ICON
+        for percent, band_icon in _HP_BANDS:
+            if scaled_health <= percent * maximum:
+                icon = band_icon
+                break
+        
+        self._hp_icon_cache = (current, maximum, icon)
+        return icon
     
-    def add_line(self, line, delay=None):
+    def add_line(self, line, delay=None, quiet=False):
         """
         Add a line to the scrolling content area and refresh display.
         
         Args:
-            line (str): Line to add to the scroll
-            delay (float): Optional delay after adding the line. If None, uses self.line_delay
+            line (str): Line to add to the scroll; None is ignored
+            delay (float): Optional delay after adding the line. None or 0 means no delay
+            quiet (bool): Skip the refresh, for callers that add several lines
+                and refresh once themselves
         """
-        # Remove the first line and append the new line
-        self.content_lines.pop(0)
-        self.content_lines.append(line)
-        self.refresh_display()
+        if line is None:
+            return
         
-        # Add delay if specified (use debug delay if in debug mode)
-        if delay is not None and delay > 0:
-            actual_delay = self.debug_delay if self.debug_mode else delay
-            time.sleep(actual_delay)
+        # Append first so the line is on screen before any pause; the deque
+        # drops the oldest line automatically
+        self.content_lines.append(line)
+        self._content_dirty = True
+        if not (quiet or self._suspend_refresh):
+            self.refresh_display()
+        
+        # Most lines have no delay: stop before any mode checks
+        if not delay:
+            return
+        
+        # Use debug delay if in debug mode
+        if self._debug_mode:
+            delay = self._debug_delay
+        if delay > 0:
+            self._pause(delay)
     
     def add_lines(self, lines, delay=None, sleep=None):
         """
         Add multiple lines to the scrolling content area with full control over timing.
         
+        All lines are appended and drawn in one refresh, followed by a single
+        pause covering every line's delay.
+        
         Args:
-            lines (list or str): Lines to add
-            delay (float, optional): Delay after each line. If None, uses default delays
+            lines (list or str): Lines to add; None entries are skipped
+            delay (float, optional): Delay per line. If None, uses default delays
             sleep (float, optional): Additional sleep after all lines are added
         """
         if isinstance(lines, str):
             lines = lines.split('\n')
+        else:
+            # None entries are skipped, as in add_line
+            lines = [line for line in lines if line is not None]
+        
+        self.content_lines.extend(lines)
+        self._content_dirty = True
+        
+        # Inside batch() the screen is only drawn on exit, so pausing here
+        # would just stall with nothing new shown
+        if self._suspend_refresh:
+            return
+        
+        self.refresh_display()
         
         # Determine delay to use
         if delay is None:
-            # Use debug delay if in debug mode, otherwise use default line delay
-            if self.debug_mode:
-                line_delay = self.debug_delay
-            else:
-                line_delay = self.line_delay
+            # Debug delay in debug mode, otherwise the default line delay
+            line_delay = self._active_line_delay
         else:
             # Use specified delay (respects debug mode)
-            if self.debug_mode:
-                line_delay = self.debug_delay
-            else:
-                line_delay = delay
-        
-        # Add each line with the determined delay
-        for line in lines:
-            self.add_line(line, delay=line_delay)
+            line_delay = self._debug_delay if self._debug_mode else delay
         
-        # Additional sleep if specified
+        # One pause for the whole block instead of one per line
+        pause = line_delay * len(lines)
         if sleep is not None and sleep > 0:
-            actual_sleep = self.debug_delay if self.debug_mode else sleep
-            os.sleep(actual_sleep)
+            pause += self._debug_delay if self._debug_mode else sleep
+        if pause > 0:
+            self._pause(pause)
 
     def print_header(self):
         """Print the static header bar with dynamic HP information."""
-        print("=" * self.ui_width)
-        dynamic_header = self.get_dynamic_header()
-        centered_title = f"    {dynamic_header}    ".center(self.ui_width, "=")
-        print(centered_title)
-        print("=" * self.ui_width)
+        self._write_frame(self._encode(self._render_header()))
+    
+    def _render_header(self):
+        """Build the header bar (with trailing newline) as a single string."""
+        bar = "=" * self.ui_width
+        dynamic_header = self.get_dynamic_header() if self.show_hp_in_header else self.header_text
+        title = f"    {dynamic_header}    "
+        left_pad, right_pad = self._get_title_pads(len(title))
+        return f"{bar}\n{left_pad}{title}{right_pad}\n{bar}\n"
+    
+    def _get_title_pads(self, title_len):
+        """
+        Get the "=" padding that centers a title of the given length.
+        
+        Matches str.center's placement of the odd character and is cached
+        for the last length, since the header rarely changes size.
+        
+        Args:
+            title_len (int): Length of the title to center
+            
+        Returns:
+            tuple: (left_pad, right_pad) strings
+        """
+        if title_len != self._title_len:
+            margin = self.ui_width - title_len
+            if margin > 0:
+                left = margin // 2 + (margin & self.ui_width & 1)
+                self._title_pads = ("=" * left, "=" * (margin - left))
+            else:
+                self._title_pads = ("", "")
+            self._title_len = title_len
+        return self._title_pads
     
     def print_footer(self):
         """Print the static footer bar."""
-        print("=" * self.ui_width)
+        self._write_frame(self._footer_bytes)
+    
+    def _render_footer(self):
+        """Build the footer bar (with trailing newline) as a single string."""
+        bar = "=" * self.ui_width
         if self.footer_text:
-            centered_message = self.footer_text.center(self.ui_width)
-            print(centered_message)
-        print("=" * self.ui_width)
+            return f"{bar}\n{self.footer_text.center(self.ui_width)}\n{bar}\n"
+        return f"{bar}\n{bar}\n"
     
     def refresh_display(self):
         """Refresh the entire display with current content."""
-        self.clear_screen()
-        
-        # Print header
-        self.print_header()
-        
-        # Print content area
+        # Assemble clear, header, content area and footer into one byte buffer
+        encode = self._encode
+        buf = io.BytesIO()
+        if self._ansi_clear:
+            buf.write(self._clear_bytes)
+        else:
+            self.clear_screen()
+        buf.write(encode(self._render_header()))
+        # Footer and HP header changes redraw without re-encoding the content
+        if self._content_dirty:
+            self._content_bytes = self._render_content()
+            self._content_dirty = False
+        buf.write(self._content_bytes)
+        buf.write(self._footer_bytes)
+        
+        self._write_frame(buf.getvalue())
+    
+    def _render_content(self):
+        """Build the padded content area, encoded for the terminal."""
+        encode = self._encode
+        text_width = self.ui_width - 4  # Width left after the 2-space margin
+        blank_line = self._blank_line_bytes
+        rows = []
         for line in self.content_lines:
             # Pad lines to fit width and add left margin
-            padded_line = f"  {line}".ljust(self.ui_width - 2)
-            print(padded_line)
+            if line == "":
+                rows.append(blank_line)
+            else:
+                rows.append(encode(f"  {str(line).ljust(text_width)}\n"))
+        return b"".join(rows)
+    
+    def _encode(self, text):
+        """Encode text for the terminal, replacing characters it can't show."""
+        return text.encode(self._stdout_encoding, errors="replace")
+    
+    def _write_frame(self, frame):
+        """
+        Write a fully assembled frame to the terminal.
+        
+        Uses a raw os.write on the cached stdout descriptor to skip the
+        TextIOWrapper's per-call locking and encoding. Falls back to
+        sys.stdout.write when stdout has been redirected (tests, pipes set
+        up by the caller) so the output still goes where Python expects.
         
-        # Print footer
-        self.print_footer()
+        Args:
+            frame (bytes): Complete frame, encoded for the terminal
+        """
+        stream = sys.stdout
+        if self._stdout_fd is None or stream is not sys.__stdout__:
+            stream.write(frame.decode(self._stdout_encoding, errors="replace"))
+            stream.flush()
+            return
+        
+        # Flush anything print() buffered elsewhere so output stays in order
+        stream.flush()
+        view = memoryview(frame)
+        while view:
+            written = os.write(self._stdout_fd, view)
+            view = view[written:]
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group several add_line calls into a single screen refresh.
+        
+        Lines added inside the block are appended without redrawing; the
+        display is refreshed once when the block exits. add_lines skips its
+        pause inside the block, but an explicit add_line delay still sleeps
+        on the undrawn screen, so only use this for lines without delays.
+        """
+        previous = self._suspend_refresh
+        self._suspend_refresh = True
+        try:
+            yield self
+        finally:
+            self._suspend_refresh = previous
+        if not previous:
+            self.refresh_display()
     
     def clear_content(self):
         """Clear the scrolling content area."""
-        self.content_lines = [""] * self.window_height
+        self.content_lines.clear()
+        self.content_lines.extend([""] * self.window_height)
+        self._content_dirty = True
     
     def display_text(self, text, exposition=False, pause=False, title="PythonDungeon"):
         """
@@ -267,80 +708,120 @@ class Display:
         
         # Add a separator line before new content
         self.add_line("")
-        separator_delay = self.debug_delay if self.debug_mode else 0.3
-        self.add_line("-" * 60, delay=separator_delay)
+        self.add_line("-" * 60, delay=self._active_line_delay)
         
         # Add status/intro content
         if status:
-            status_lines = status.split('\n')
             delay = self.exposition_line_delay if exposition_intro else None
-            self.add_lines(status_lines, delay=delay)
+            self.add_lines(_build_menu_lines(status), delay=delay)
         
         self.add_line("")
         
-        # Create footer options text with shortened versions
-        short_options = []
-        for i, option in enumerate(options, 1):
-            # Extract key words from option for shorter footer display
-            if "Rest" in option:
-                short_options.append(f"{i}) 🛏️ Rest")
-            elif "adventure" in option.lower():
-                short_options.append(f"{i}) 🗺️ Adventure")
-            elif any(location in option for location in ["Forest", "Cave", "Desert", "Mountain", "Dungeon"]):
-                # Extract the emoji and location name from the full option text
-                # This handles dynamic location names without hardcoding
-                if "🌲" in option:  # Forest
-                    short_options.append(f"{i}) 🌲 Forest")
-                elif "🕳️" in option:  # Cave
-                    short_options.append(f"{i}) 🕳️ Cave")
-                elif "🏜️" in option:  # Desert  
-                    short_options.append(f"{i}) 🏜️ Desert")
-                elif "⛰️" in option:  # Mountain
-                    short_options.append(f"{i}) ⛰️ Mountain")
-                elif "🏰" in option:  # Dungeon
-                    short_options.append(f"{i}) 🏰 Dungeon")
-                else:
-                    # Fallback: try to extract emoji and first word after it
-                    parts = option.split()
-                    if len(parts) >= 2:
-                        emoji = parts[0]
-                        location = parts[1]
-                        short_options.append(f"{i}) {emoji} {location}")
-                    else:
-                        short_options.append(f"{i}) {option}")
-            elif "stats" in option:
-                short_options.append(f"{i}) 📊 Stats")
-            elif "Save game" in option:
-                short_options.append(f"{i}) 💾 Save")
-            elif "Settings" in option:
-                short_options.append(f"{i}) ⚙️ Settings")
-            elif "Quit" in option:
-                short_options.append(f"{i}) 🚪 Quit")
-            elif "Continue exploring" in option:
-                short_options.append(f"{i}) 🌲 Continue")
-            elif "Return to" in option:
-                short_options.append(f"{i}) 🏠 Return")
-            else:
-                # Fallback to first few words
-                words = option.split()[:3]
-                short_options.append(f"{i}) {' '.join(words)}")
+        # Footer text for this set of options (cached across menu calls)
+        options_text = _build_options_text(tuple(options))
+        valid_choices = _valid_menu_choices(len(options))
         
-        options_text = " | ".join(short_options) + ": "
-        
-        # Get user choice using footer
+        # Get user choice using footer; the menu is drawn once, and invalid
+        # input only rewrites the prompt line
+        self.set_footer(options_text)
+        self.refresh_display()
         while True:
             try:
-                self.set_footer(options_text)
-                self.refresh_display()
-                choice = input().strip()
-                if choice.isdigit() and 1 <= int(choice) <= len(options):
+                choice = self._read_choice(single_key=len(options) <= 9)
+                if choice in valid_choices:
                     self.set_footer("")  # Clear footer after successful choice
                     return choice
-                self.add_line(f"Please choose a number between 1 and {len(options)}.")
+                self._prompt_error(f"Please choose a number between 1 and {len(options)}: ")
             except (EOFError, KeyboardInterrupt):
                 self.add_line("Game interrupted.")
                 return "quit"
     
+    def _prompt_error(self, message):
+        """
+        Show an invalid-input message on the prompt line without a redraw.
+        
+        The rejected answer was echoed with its Enter, leaving the cursor one
+        row below the prompt, so the message goes back up onto the prompt row
+        to keep the fixed layout from drifting down on every bad entry.
+        
+        Args:
+            message (str): Message to show, doubling as the new prompt
+        """
+        if self._ansi_clear:
+            # Cursor up one row, back to column 1, and erase that row
+            self._write_frame(self._encode("\x1b[1A\r\x1b[K" + message))
+        else:
+            # No cursor movement without escapes; redraw the frame instead
+            self.refresh_display()
+            self._write_frame(self._encode(message))
+    
+    def _read_choice(self, single_key=False):
+        """
+        Read one line of user input for a menu prompt.
+        
+        Reads straight from sys.stdin rather than through input(), which
+        sets up readline hooks on every call of the prompt loops.
+        
+        Args:
+            single_key (bool): Every valid choice is one digit, so on a
+                terminal a digit keypress is returned without waiting for
+                Enter. Anything else is read as a full line (e.g. "quit").
+        
+        Returns:
+            str: The stripped line
+            
+        Raises:
+            EOFError: If stdin is exhausted
+        """
+        if single_key and self._can_read_keys():
+            key = self._read_key()
+            if not key or key == "\x04":  # Ctrl-D has no special meaning in cbreak mode
+                raise EOFError
+            # Keys aren't echoed while reading them, so echo the one we got
+            if key.isdigit():
+                self._write_frame(self._encode(key + "\n"))
+                return key
+            if key in "\r\n":
+                self._write_frame(b"\n")
+                return ""
+            # Not a digit: read the rest of the line in normal mode
+            self._write_frame(self._encode(key))
+            return (key + sys.stdin.readline()).strip()
+        
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+    
+    def _can_read_keys(self):
+        """Whether menu input comes from an interactive terminal that can be read per key."""
+        stdin = sys.stdin
+        try:
+            return stdin is sys.__stdin__ and stdin.isatty()
+        except (AttributeError, OSError, ValueError):
+            return False
+    
+    def _read_key(self):
+        """
+        Read a single keypress from the terminal without waiting for Enter.
+        
+        Returns:
+            str: The key, or "" at end of input
+        """
+        if os.name == 'nt':
+            import msvcrt
+            return msvcrt.getwch()
+        
+        import termios
+        import tty
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            return sys.stdin.read(1)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    
     def display_stats(self, character):
         """
         Display character stats by appending to the scrolling window.
@@ -352,10 +833,11 @@ class Display:
         self.set_footer("")  # Clear footer initially
         
         # Add separator and stats to scrolling content
-        self.add_line("")
-        self.add_line("-" * 40)
-        self.add_line(f"📊 {character.name}'s Stats:")
-        self.add_line("")
+        with self.batch():
+            self.add_line("")
+            self.add_line("-" * 40)
+            self.add_line(f"📊 {character.name}'s Stats:")
+            self.add_line("")
         
         stats_lines = [
             f"Name: {character.name}",
@@ -399,16 +881,16 @@ class Display:
         """
         options_text = "1) ⚔️ Attack  2) 💚 Heal  3) 🏃 Try to flee"
         
+        self.set_footer(options_text)
+        self.refresh_display()
         while True:
             try:
-                self.set_footer(options_text)
-                self.refresh_display()
-                choice = input().strip()
-                if choice in ['1', '2', '3']:
+                choice = self._read_choice(single_key=True)
+                if choice in _COMBAT_CHOICES:
                     # Clear footer after successful choice
                     self.set_footer("")
                     return choice
-                self.add_line(f"Please choose 1, 2, or 3.")
+                self._prompt_error("Please choose 1, 2, or 3: ")
             except (EOFError, KeyboardInterrupt):
                 return "quit"
 
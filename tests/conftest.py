@@ -3,88 +3,265 @@ Pytest configuration and shared fixtures for PythonDungeon tests
 """
 
 import pytest
+import copy
 import os
-import tempfile
+import random
 import sqlite3
-from unittest.mock import Mock, patch
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import patch
 
-# Import our modules
-from src.core.player import Player
-from src.core.gamedata import GameDatabase
-from src.locations.forest import Forest
-from src.locations.inn import Inn
-from src.locations.adventure import Adventure
+# Game modules are imported inside the fixtures that need them, so narrow
+# test runs (-k, single files) only import what they actually use.
 
 
-@pytest.fixture
-def temp_db():
-    """Create a temporary database for testing."""
-    # Create temporary file
-    temp_fd, temp_path = tempfile.mkstemp(suffix='.db')
-    os.close(temp_fd)  # Close file descriptor, but keep the file
+# Named shared-cache in-memory database, alive while any connection is open
+TEST_DB_URI = "file:pythondungeon_test?mode=memory&cache=shared"
+
+@pytest.fixture(scope="session")
+def db_conn():
+    """Hold one connection open so the shared in-memory test database survives."""
+    keepalive = sqlite3.connect(TEST_DB_URI, uri=True)
     
-    # Create database instance with temp path
-    db = GameDatabase(temp_path)
+    # Tests read back through this connection instead of opening their own
+    yield keepalive
     
-    yield db
+    keepalive.close()
+
+
+@pytest.fixture(scope="session")
+def _session_db(db_conn):
+    """Create the in-memory test database once per session."""
+    from src.core.gamedata import GameDatabase
     
-    # Cleanup: remove temp database file
-    try:
-        os.unlink(temp_path)
-    except OSError:
-        pass
+    # Schema creation and monster seeding only run once
+    return GameDatabase(TEST_DB_URI)
+
+
+@pytest.fixture(scope="session")
+def _seeded_snapshot(_session_db):
+    """Keep a private copy of the freshly seeded test database."""
+    snapshot = sqlite3.connect(":memory:")
+    source = sqlite3.connect(TEST_DB_URI, uri=True)
+    source.backup(snapshot)
+    source.close()
+    
+    yield snapshot
+    
+    snapshot.close()
+
+
+@pytest.fixture(scope="session")
+def db_schema(_session_db, db_conn):
+    """Map each table in the test database to its set of column names."""
+    tables = [row[0] for row in db_conn.execute("SELECT name FROM sqlite_master WHERE type='table'")]
+    return {
+        table: {column[1] for column in db_conn.execute(f"PRAGMA table_info({table})")}
+        for table in tables
+    }
+
+
+@pytest.fixture
+def temp_db(_session_db, _seeded_snapshot):
+    """Provide the test database, reset to its freshly seeded state after each test."""
+    yield _session_db
+    
+    # Cleanup: copy the snapshot back over every table, so changes to players,
+    # stats, settings and monster templates don't leak into later tests
+    conn = sqlite3.connect(TEST_DB_URI, uri=True)
+    _seeded_snapshot.backup(conn)
+    conn.close()
 
 
 @pytest.fixture
 def test_player():
     """Create a test player instance."""
+    from src.core.player import Player
     return Player("TestHero", emoji="🧙")
 
 
+@pytest.fixture(scope="session")
+def combat():
+    """Create one Combat instance for the session (it holds no state)."""
+    from src.core.combat import Combat
+    return Combat()
+
+
+@pytest.fixture
+def hero():
+    """Create a level 2 player for the combat and inn tests."""
+    from src.core.player import Player
+    return Player("Hero", level=2, experience=50)
+
+
+@pytest.fixture
+def goblin():
+    """Create a level 2 goblin for combat tests."""
+    from src.entities.monster import Monster
+    return Monster("Goblin", max_health=20, strength=5, level=2)
+
+
 @pytest.fixture
 def test_player_with_db(temp_db):
     """Create a test player and save it to temp database."""
+    from src.core.player import Player
     player = Player("TestHero", emoji="🧙")
     temp_db.save_player(player)
     yield player
 
 
+@pytest.fixture(scope="session")
+def base_settings():
+    """Build GameSettings, which reads config/settings.json, once per session."""
+    from src.config.gamesettings import GameSettings
+    return GameSettings()
+
+
+@pytest.fixture
+def settings(base_settings):
+    """Give each test its own copy of the session's GameSettings."""
+    return copy.copy(base_settings)
+
+
+@pytest.fixture(scope="session")
+def settings_root(tmp_path_factory):
+    """Create one scratch directory shared by the settings tests that write files."""
+    return tmp_path_factory.mktemp("gamesettings")
+
+
+@pytest.fixture
+def settings_dir(settings_root, request, monkeypatch):
+    """Run the test from its own empty directory under settings_root."""
+    # save_settings writes config/settings.json relative to the cwd
+    path = settings_root / request.node.name
+    path.mkdir()
+    monkeypatch.chdir(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def basic_sword_template():
+    """Build the starter sword once per module; don't mutate it."""
+    from src.equipment.equipment import create_basic_sword
+    return create_basic_sword()
+
+
+@pytest.fixture
+def basic_sword(basic_sword_template):
+    """Give each test its own copy of the starter sword."""
+    return copy.copy(basic_sword_template)
+
+
+@pytest.fixture(scope="module")
+def basic_armor_template():
+    """Build the starter armor set once per module; don't mutate it."""
+    from src.equipment.equipment import create_basic_armor
+    return create_basic_armor()
+
+
+@pytest.fixture
+def basic_armor(basic_armor_template):
+    """Give each test its own copies of the starter armor pieces."""
+    return {key: copy.copy(piece) for key, piece in basic_armor_template.items()}
+
+
+@pytest.fixture(scope="module")
+def basic_ring_template():
+    """Build the starter ring once per module; don't mutate it."""
+    from src.equipment.equipment import create_basic_ring
+    return create_basic_ring()
+
+
+@pytest.fixture
+def basic_ring(basic_ring_template):
+    """Give each test its own copy of the starter ring."""
+    return copy.copy(basic_ring_template)
+
+
+@pytest.fixture(scope="module")
+def _shared_inventory():
+    """Build one default Inventory per module for the inventory fixture."""
+    from src.equipment.inventory import Inventory
+    return Inventory()
+
+
+@pytest.fixture
+def inventory(_shared_inventory):
+    """Hand out the shared default Inventory, emptied after each test."""
+    yield _shared_inventory
+    _shared_inventory.items.clear()
+
+
+@pytest.fixture
+def inventory_with_sword(inventory, basic_sword):
+    """Hand out the shared Inventory holding this test's starter sword."""
+    inventory.add_item(basic_sword)
+    return inventory
+
+
+@pytest.fixture
+def make_inventory():
+    """Build an Inventory with a specific capacity."""
+    from src.equipment.inventory import Inventory
+    return lambda max_capacity=50: Inventory(max_capacity=max_capacity)
+
+
 @pytest.fixture
 def forest_adventure():
     """Create a Forest adventure instance."""
+    from src.locations.forest import Forest
     return Forest()
 
 
+@pytest.fixture
+def patched_adventure_loader():
+    """Limit adventures to Forest and stub out its adventure loop."""
+    from src.locations.adventure import Adventure
+    from src.locations.forest import Forest
+    
+    # Enter every patch once and hand the mocks to the test together
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            load=stack.enter_context(
+                patch.object(Adventure, '_load_adventures', return_value={'forest': Forest})),
+            start=stack.enter_context(
+                patch.object(Forest, 'start_adventure', return_value="returned")),
+        )
+
+
 @pytest.fixture
 def inn_instance():
     """Create an Inn instance."""
+    from src.locations.inn import Inn
     return Inn()
 
 
 @pytest.fixture
 def mock_display():
     """Mock the display system for testing."""
-    with patch('src.ui.display.display') as mock_disp:
-        # Set up common mock behaviors
-        mock_disp.add_line = Mock()
-        mock_disp.display_text = Mock()
-        mock_disp.display_menu = Mock(return_value="1")
-        mock_disp.clear_content = Mock()
-        mock_disp.set_header = Mock()
-        mock_disp.set_player_for_header = Mock()
-        mock_disp.clear_hp_header = Mock()
-        mock_disp.refresh_display = Mock()
+    from src.ui.display import Display
+    
+    # spec'd MagicMock creates callable children lazily for Display's methods
+    with patch('src.ui.display.display', spec=Display) as mock_disp:
+        mock_disp.configure_mock(**{"display_menu.return_value": "1"})
         yield mock_disp
 
 
 @pytest.fixture
 def mock_input():
-    """Mock user input for testing."""
-    with patch('builtins.input') as mock_inp:
+    """Mock user input for testing (both input() and menu reads from stdin)."""
+    with patch('builtins.input') as mock_inp, patch('sys.stdin') as mock_stdin:
         mock_inp.return_value = "1"
+        mock_stdin.readline.return_value = "1\n"
         yield mock_inp
 
 
+@pytest.fixture(autouse=True)
+def _seed():
+    """Seed the global RNG so tests that don't patch randomness are repeatable."""
+    random.seed(0)
+
+
 @pytest.fixture(autouse=True) 
 def setup_test_environment():
     """Automatically set up test environment for each test."""
@@ -104,6 +281,14 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: Integration tests") 
     config.addinivalue_line("markers", "slow: Slow running tests")
     config.addinivalue_line("markers", "database: Tests that use database")
+    config.addinivalue_line("markers", "equipment: Equipment, inventory and equipped-items tests")
+
+
+# Markers that keep a test from being auto-marked as a unit test
+NON_UNIT_MARKERS = frozenset({'integration', 'slow', 'database'})
+
+# Fixtures that make a test a database test
+DATABASE_FIXTURES = frozenset({'temp_db', 'test_player_with_db', 'db_schema'})
 
 
 # Custom test collection
@@ -111,11 +296,10 @@ def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers automatically."""
     for item in items:
         # Add unit marker to all tests by default
-        if not any(marker.name in ['integration', 'slow', 'database'] 
-                  for marker in item.iter_markers()):
+        marker_names = {marker.name for marker in item.iter_markers()}
+        if NON_UNIT_MARKERS.isdisjoint(marker_names):
             item.add_marker(pytest.mark.unit)
         
         # Add database marker to tests that use database fixtures
-        if any(fixture_name in ['temp_db', 'test_player_with_db'] 
-               for fixture_name in item.fixturenames):
+        if not DATABASE_FIXTURES.isdisjoint(item.fixturenames):
             item.add_marker(pytest.mark.database)
\ No newline at end of file
@@ -150,36 +150,32 @@ class TestAdventureSelectionMenu:
             assert result == "cancelled"
             mock_display.add_line.assert_called_with("🏠 You decide to stay at the inn for now.")
     
-    def test_start_adventure_by_key_valid(self, test_player):
+    def test_start_adventure_by_key_valid(self, test_player, patched_adventure_loader):
         """Test starting adventure with valid key."""
-        with patch.object(Adventure, '_load_adventures', return_value={'forest': Forest}):
-            with patch.object(Forest, 'start_adventure', return_value="returned") as mock_start:
-                result = Adventure.start_adventure_by_key('forest', test_player)
-                
-                assert result == "returned"
-                mock_start.assert_called_once_with(test_player)
-    
-    def test_start_adventure_by_key_invalid(self, test_player):
+        result = Adventure.start_adventure_by_key('forest', test_player)
+        
+        assert result == "returned"
+        patched_adventure_loader.start.assert_called_once_with(test_player)
+    
+    def test_start_adventure_by_key_invalid(self, test_player, patched_adventure_loader):
         """Test starting adventure with invalid key."""
-        with patch.object(Adventure, '_load_adventures', return_value={'forest': Forest}):
-            with pytest.raises(ValueError, match="Adventure 'invalid' not found"):
-                Adventure.start_adventure_by_key('invalid', test_player)
+        with pytest.raises(ValueError, match="Adventure 'invalid' not found"):
+            Adventure.start_adventure_by_key('invalid', test_player)
 
 
 @pytest.mark.integration
 class TestAdventureIntegration:
     """Integration tests for the adventure system."""
     
-    def test_full_adventure_flow(self, test_player, mock_display, mock_input):
+    def test_full_adventure_flow(self, test_player, mock_display, mock_input,
+                                 patched_adventure_loader):
         """Test complete adventure selection and execution flow."""
-        # Mock the forest adventure to return quickly
-        with patch.object(Forest, 'start_adventure', return_value="returned"):
-            # Mock user selecting forest (option 1)
-            mock_display.display_menu.return_value = "1"
-            
-            result = Adventure.show_adventure_selection_menu(test_player)
-            
-            assert result == "returned"
+        # Mock user selecting forest (option 1)
+        mock_display.display_menu.return_value = "1"
+        
+        result = Adventure.show_adventure_selection_menu(test_player)
+        
+        assert result == "returned"
     
     @pytest.mark.slow
     def test_adventure_with_mock_combat(self, test_player, forest_adventure):
@@ -4,128 +4,99 @@ Test suite for the combat system.
 Tests turn-based combat mechanics, damage calculation, and combat flow.
 """
 
+import random
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch, MagicMock
 from src.core.combat import Combat
 from src.core.player import Player
 from src.entities.monster import Monster
 
 
+@pytest.fixture(autouse=True)
+def mock_display(monkeypatch):
+    """Replace the display combat draws to, always choosing to attack."""
+    mock_disp = MagicMock()
+    mock_disp.display_combat_options.return_value = "1"  # Always attack
+    monkeypatch.setattr("src.core.combat.display", mock_disp)
+    # Answer the "Press Enter" prompt and skip the pause between turns
+    monkeypatch.setattr("builtins.input", lambda *_: "")
+    monkeypatch.setattr("src.core.combat.time.sleep", lambda *_: None)
+    return mock_disp
+
+
 class TestCombatSystem:
     """Test the core combat system functionality."""
     
-    def test_combat_creation(self):
+    def test_combat_creation(self, combat):
         """Test combat system initialization."""
-        combat = Combat()
-        
         assert hasattr(combat, 'calculate_damage')
         assert hasattr(combat, 'take_damage')
         assert hasattr(combat, 'run_combat')
         assert hasattr(combat, 'attempt_flee')
         assert hasattr(combat, 'calculate_critical_hit')
     
-    def test_calculate_damage_basic(self):
-        """Test basic damage calculation."""
-        combat = Combat()
-        
-        # Test damage calculation with base damage
-        base_damage = 10
+    @pytest.mark.parametrize("base_damage,low,high", [
+        (10, 8, 12),             # 80-120% of base damage
+        (1, 1, float("inf")),    # Always at least 1
+        (0.5, 1, float("inf")),  # Very small base damage rounds up to 1
+    ])
+    def test_calculate_damage(self, combat, base_damage, low, high):
+        """Test damage calculation stays within the expected range."""
         calculated_damage = combat.calculate_damage(base_damage)
         
         assert isinstance(calculated_damage, int)
-        assert calculated_damage > 0
-        # Should be 80-120% of base damage (8-12 for base_damage=10)
-        assert 8 <= calculated_damage <= 12
-    
-    def test_calculate_damage_minimum(self):
-        """Test damage calculation always returns at least 1."""
-        combat = Combat()
-        
-        # Test very low damage
-        calculated_damage = combat.calculate_damage(1)
-        assert calculated_damage >= 1
-    
-    def test_take_damage_basic(self):
-        """Test basic damage application."""
-        combat = Combat()
-        
-        # Test normal damage
-        new_health, is_alive = combat.take_damage(50, 20)
-        assert new_health == 30
-        assert is_alive is True
-        
-        # Test lethal damage
-        new_health, is_alive = combat.take_damage(10, 15)
-        assert new_health == 0
-        assert is_alive is False
-    
-    def test_take_damage_exact_lethal(self):
-        """Test exact lethal damage."""
-        combat = Combat()
-        
-        new_health, is_alive = combat.take_damage(20, 20)
-        assert new_health == 0
-        assert is_alive is False
-    
-    def test_attempt_flee_success(self):
-        """Test successful flee attempt."""
-        combat = Combat()
-        
-        # Test with high success chance
-        result = combat.attempt_flee(success_chance=1.0)
-        assert result is True
-    
-    def test_attempt_flee_failure(self):
-        """Test failed flee attempt."""
-        combat = Combat()
-        
-        # Test with no success chance
-        result = combat.attempt_flee(success_chance=0.0)
-        assert result is False
-    
-    def test_calculate_critical_hit_no_crit(self):
-        """Test critical hit calculation when no crit occurs."""
-        combat = Combat()
-        
-        with patch('random.random', return_value=0.5):  # No crit (chance is 0.1)
-            damage, is_crit = combat.calculate_critical_hit(10, crit_chance=0.1)
-            assert damage == 10
-            assert is_crit is False
-    
-    def test_calculate_critical_hit_with_crit(self):
-        """Test critical hit calculation when crit occurs."""
-        combat = Combat()
-        
-        with patch('random.random', return_value=0.05):  # Crit occurs (chance is 0.1)
-            damage, is_crit = combat.calculate_critical_hit(10, crit_chance=0.1, crit_multiplier=2.0)
-            assert damage == 20  # 10 * 2.0
-            assert is_crit is True
+        assert low <= calculated_damage <= high
+    
+    @pytest.mark.parametrize("health,damage,expected_health,alive", [
+        (50, 20, 30, True),   # Normal damage
+        (10, 15, 0, False),   # Lethal damage
+        (20, 20, 0, False),   # Exact lethal damage
+        (50, -10, 50, True),  # Negative damage should not increase health
+    ])
+    def test_take_damage(self, combat, health, damage, expected_health, alive):
+        """Test damage application."""
+        new_health, is_alive = combat.take_damage(health, damage)
+        assert new_health == expected_health
+        assert is_alive is alive
+    
+    @pytest.mark.parametrize("success_chance,expected", [
+        (1.0, "fled"),    # Certain escape
+        (0.0, "failed"),  # No chance to escape
+    ])
+    def test_attempt_flee(self, combat, success_chance, expected):
+        """Test flee attempts at the extremes of success chance."""
+        result = combat.attempt_flee(success_chance=success_chance)
+        assert result == expected
+    
+    @pytest.mark.parametrize("seed,crit_multiplier,expected_damage,expected_crit", [
+        (5, 1.5, 10, False),   # First roll 0.62: no crit (chance is 0.1), damage roll 10
+        (31, 2.0, 20, True),   # First roll 0.01: crit occurs, 10 * 2.0
+    ])
+    def test_calculate_critical_hit(self, seed, crit_multiplier,
+                                    expected_damage, expected_crit):
+        """Test critical hit calculation with and without a crit."""
+        combat = Combat(rng=random.Random(seed))
+        
+        damage, is_crit = combat.calculate_critical_hit(
+            10, crit_chance=0.1, crit_multiplier=crit_multiplier)
+        assert damage == expected_damage
+        assert is_crit is expected_crit
 
 
 class TestCombatFlow:
     """Test the overall combat flow and integration."""
     
-    @patch('src.ui.display.display')
-    def test_run_combat_basic(self, mock_display):
+    def test_run_combat_basic(self, mock_display, combat, hero, goblin):
         """Test basic combat execution."""
-        combat = Combat()
-        player = Player("Hero", level=2, experience=50)
-        monster = Monster("Goblin", max_health=20, strength=5, level=2)
-        
-        # Mock the display system
-        mock_display.display_menu.return_value = "1"  # Always attack
-        mock_display.add_line = Mock()
-        
         # Mock combat to end quickly
         with patch.object(combat, 'calculate_damage', return_value=25):  # High damage to end combat
-            result = combat.run_combat(player, monster)
+            result = combat.run_combat(hero, goblin)
             
             # Combat should end with player victory
             assert result in ["victory", "defeat", "fled"]
     
-    def test_check_health_threshold(self):
+    def test_check_health_threshold(self, combat):
         """Test monster health threshold checking."""
-        combat = Combat()
         monster = Monster("Test", max_health=100, strength=10, level=1)
         crossed_thresholds = set()
         
@@ -136,99 +107,102 @@ class TestCombatFlow:
         # Should detect 75% threshold
         assert len(crossed_thresholds) > 0 or result is not None
     
-    def test_check_player_health_threshold(self):
+    def test_check_player_health_threshold(self, combat, hero):
         """Test player health threshold checking."""
-        combat = Combat()
-        player = Player("Hero", level=2, experience=50)
-        player.current_health = 25  # Assume max health is 50+
+        hero.current_health = 25  # Assume max health is 50+
         crossed_thresholds = set()
         
-        result = combat.check_player_health_threshold(player, crossed_thresholds)
+        result = combat.check_player_health_threshold(hero, crossed_thresholds)
         
         # Should handle threshold checking without errors
         assert result is None or isinstance(result, str)
 
 
-class TestCombatEdgeCases:
-    """Test edge cases and error conditions."""
-    
-    def test_combat_with_zero_health_monster(self):
-        """Test combat behavior with zero health monster."""
-        combat = Combat()
-        player = Player("Hero", level=2, experience=50)
-        monster = Monster("Dead", max_health=1, strength=1, level=1)
-        monster.current_health = 0
-        monster.is_alive = False
-        
-        # Combat should handle dead monster appropriately
-        with patch('src.ui.display.display') as mock_display:
-            mock_display.add_line = Mock()
-            mock_display.display_menu.return_value = "1"
-            
-            result = combat.run_combat(player, monster)
-            assert result in ["victory", "defeat", "fled"]
-    
-    def test_negative_damage_calculation(self):
-        """Test damage calculation with edge values."""
-        combat = Combat()
-        
-        # Test with very small base damage
-        damage = combat.calculate_damage(0.5)  # Should round up to at least 1
-        assert damage >= 1
-    
-    def test_take_damage_negative_input(self):
-        """Test damage application with negative values."""
-        combat = Combat()
-        
-        # Negative damage should not increase health
-        new_health, is_alive = combat.take_damage(50, -10)
-        assert new_health == 50  # Health should not increase
-        assert is_alive is True
+class TestCombatDamageClamping:
+    """Test the floors that keep damage rolls and damage taken sane."""
+    
+    @pytest.mark.parametrize("base_damage", [0.1, 0.5, 0.9, 1])
+    def test_calculate_damage_low_base_deals_exactly_one(self, combat, base_damage):
+        """Test that a base too small for the 120% ceiling still rolls 1 damage."""
+        assert combat.calculate_damage(base_damage) == 1
+    
+    @pytest.mark.parametrize("damage", [-1, -10, -1000])
+    def test_take_damage_ignores_negative_damage(self, combat, damage):
+        """Test that negative damage leaves health unchanged instead of healing."""
+        assert combat.take_damage(30, damage) == (30, True)
+    
+    def test_take_damage_negative_does_not_revive(self, combat):
+        """Test that negative damage cannot bring a dead target back."""
+        assert combat.take_damage(0, -5) == (0, False)
 
 
 class TestCombatIntegration:
     """Test combat integration with other systems."""
     
-    @patch('src.ui.display.display')
-    def test_combat_with_equipment_integration(self, mock_display):
-        """Test combat integration with equipment system."""
+    def test_combat_with_equipment_integration(self, combat, hero):
+        """Test that equipment strength feeds into attack damage."""
         from src.equipment import Weapon, EquippedItems
         
-        combat = Combat()
-        player = Player("Hero", level=2, experience=50)
-        
         # Give player equipment
-        player.equipped = EquippedItems()
+        hero.equipped = EquippedItems()
         sword = Weapon("Test Sword", damage=5, strength_bonus=2)
-        player.equipped.equip_item(sword)
+        hero.equipped.equip_item(sword)
         
-        monster = Monster("Target", max_health=30, strength=5, level=2)
+        bonuses = hero.equipped.get_total_stat_bonuses()
+        assert bonuses['strength'] == 2
         
-        mock_display.add_line = Mock()
-        mock_display.display_menu.return_value = "1"  # Attack
-        
-        # Test that combat can access equipment bonuses
-        with patch.object(combat, 'calculate_damage', return_value=25):
-            result = combat.run_combat(player, monster)
-            assert result in ["victory", "defeat", "fled"]
+        # Damage should stay within 80-120% of the boosted strength
+        attack_strength = hero.strength + bonuses['strength']
+        damage = combat.calculate_damage(attack_strength)
+        assert max(1, int(attack_strength * 0.8)) <= damage <= int(attack_strength * 1.2)
     
-    def test_combat_experience_integration(self):
-        """Test that combat integrates properly with experience system."""
-        combat = Combat()
+    def test_combat_experience_integration(self, combat):
+        """Test that a killing blow earns the player the victory XP."""
         player = Player("Hero", level=1, experience=0)
         monster = Monster("Weak", max_health=1, strength=1, level=1)
         
-        initial_xp = player.experience
+        # Play a single attack turn
+        damage, _ = combat.calculate_critical_hit(player.strength)
+        new_health, monster_alive = combat.take_damage(monster.current_health, damage)
+        monster.update_health(new_health)
+        
+        assert monster_alive is False
+        assert monster.is_alive is False
+        
+        # Same level: base 20 XP per monster level plus a 0-5 bonus
+        xp = combat.calculate_experience_reward(player, monster)
+        assert 20 <= xp <= 25
+        
+        leveled_up = player.add_experience(xp)
+        assert leveled_up is False
+        assert player.experience == xp
+    
+    @pytest.mark.parametrize("player_level,monster_level,low,high", [
+        (1, 3, 90, 95),   # Challenging monster: 60 * 1.5
+        (5, 3, 42, 47),   # Slightly weaker monster: 60 * 0.7
+        (10, 1, 6, 11),   # Much weaker monster: 20 * 0.3
+    ])
+    def test_experience_reward_scales_with_level_gap(self, combat, player_level,
+                                                     monster_level, low, high):
+        """Test that the XP reward scales with the monster's level relative to the player."""
+        player = Player("Hero", level=player_level)
+        monster = Monster("Target", max_health=10, strength=1, level=monster_level)
+        
+        assert low <= combat.calculate_experience_reward(player, monster) <= high
+
+
+class TestCombatEdgeCases:
+    """Test edge cases and error conditions."""
+    
+    def test_combat_with_zero_health_monster(self, mock_display, combat, hero):
+        """Test that combat against an already dead monster ends at once."""
+        monster = Monster("Dead", max_health=1, strength=1, level=1)
+        monster.current_health = 0
+        monster.is_alive = False
         
-        with patch('src.ui.display.display') as mock_display:
-            mock_display.add_line = Mock()
-            mock_display.display_menu.return_value = "1"
-            
-            # Mock high damage to ensure quick victory
-            with patch.object(combat, 'calculate_damage', return_value=10):
-                result = combat.run_combat(player, monster)
-                
-                # Player should gain XP after victory
-                if result == "victory":
-                    # XP gain happens in the combat system
-                    assert player.experience >= initial_xp
\ No newline at end of file
+        result = combat.run_combat(hero, monster)
+        
+        # No turns are played and the hero earns nothing
+        assert result == "victory"
+        mock_display.display_combat_options.assert_not_called()
+        assert hero.experience == 50
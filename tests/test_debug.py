@@ -4,12 +4,37 @@ Test suite for the debug system.
 Tests debug menu functionality and developer tools.
 """
 
+import sys
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import MagicMock, patch
 from src.debug.debug_menu import DebugMenu
 from src.core.player import Player
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _fast_debug():
+    """Skip the real sleeps behind display delays for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("time.sleep", lambda *_: None)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def mock_display(monkeypatch):
+    """Replace the display the debug menu draws to for every test."""
+    mock_disp = MagicMock()
+    # src.debug re-exports the debug_menu instance under the module's name,
+    # so patch the module object itself rather than a dotted path
+    monkeypatch.setattr(sys.modules[DebugMenu.__module__], "display", mock_disp)
+    return mock_disp
+
+
+def _saw(mock_add_line, needle):
+    """Return True if any add_line call was passed a string containing needle."""
+    return any(needle in arg for call in mock_add_line.call_args_list
+               for arg in call.args if isinstance(arg, str))
+
+
 class TestDebugMenu:
     """Test the debug menu system functionality."""
     
@@ -35,7 +60,6 @@ class TestDebugMenu:
 class TestDebugMenuMethods:
     """Test individual debug menu methods."""
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_add_level_valid_input(self, mock_input, mock_display):
         """Test adding levels with valid input."""
@@ -52,7 +76,6 @@ class TestDebugMenuMethods:
         # Check that display was called
         assert mock_display.add_line.called
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_add_level_invalid_input(self, mock_input, mock_display):
         """Test adding levels with invalid input."""
@@ -67,11 +90,8 @@ class TestDebugMenuMethods:
         assert player.level == 2
         
         # Should show error message
-        error_calls = [call for call in mock_display.add_line.call_args_list 
-                      if any("Invalid input" in str(arg) for arg in call[0])]
-        assert len(error_calls) > 0
+        assert _saw(mock_display.add_line, "Invalid input")
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_add_level_out_of_range(self, mock_input, mock_display):
         """Test adding levels with out of range input."""
@@ -86,11 +106,8 @@ class TestDebugMenuMethods:
         assert player.level == 2
         
         # Should show error message about range
-        error_calls = [call for call in mock_display.add_line.call_args_list 
-                      if any("between 1 and 10" in str(arg) for arg in call[0])]
-        assert len(error_calls) > 0
+        assert _saw(mock_display.add_line, "between 1 and 10")
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_remove_level_valid(self, mock_input, mock_display):
         """Test removing levels with valid input."""
@@ -104,7 +121,6 @@ class TestDebugMenuMethods:
         # Player should have lost 2 levels
         assert player.level == 3  # 5 - 2
     
-    @patch('src.ui.display.display')
     def test_remove_level_at_minimum(self, mock_display):
         """Test removing levels when already at level 1."""
         debug_menu = DebugMenu()
@@ -116,11 +132,8 @@ class TestDebugMenuMethods:
         assert player.level == 1
         
         # Should show cannot go below level 1 message
-        error_calls = [call for call in mock_display.add_line.call_args_list 
-                      if any("Cannot go below level 1" in str(arg) for arg in call[0])]
-        assert len(error_calls) > 0
+        assert _saw(mock_display.add_line, "Cannot go below level 1")
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_add_xp_valid(self, mock_input, mock_display):
         """Test adding XP with valid input."""
@@ -134,7 +147,6 @@ class TestDebugMenuMethods:
         # Player should have gained XP
         assert player.experience >= 150  # 50 + 100, possibly more if leveled up
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_add_xp_causes_level_up(self, mock_input, mock_display):
         """Test adding XP that causes a level up."""
@@ -147,13 +159,9 @@ class TestDebugMenuMethods:
         debug_menu._add_xp(player)
         
         # Player may have leveled up
-        level_up_calls = [call for call in mock_display.add_line.call_args_list 
-                         if any("LEVEL UP" in str(arg) for arg in call[0])]
-        
         if player.level > initial_level:
-            assert len(level_up_calls) > 0
+            assert _saw(mock_display.add_line, "LEVEL UP")
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_remove_xp_valid(self, mock_input, mock_display):
         """Test removing XP with valid input."""
@@ -167,7 +175,6 @@ class TestDebugMenuMethods:
         # Player should have lost XP
         assert player.experience == 100  # 150 - 50
     
-    @patch('src.ui.display.display')
     def test_remove_xp_no_xp(self, mock_display):
         """Test removing XP when player has no XP."""
         debug_menu = DebugMenu()
@@ -176,11 +183,8 @@ class TestDebugMenuMethods:
         debug_menu._remove_xp(player)
         
         # Should show no XP message
-        error_calls = [call for call in mock_display.add_line.call_args_list 
-                      if any("No XP to remove" in str(arg) for arg in call[0])]
-        assert len(error_calls) > 0
+        assert _saw(mock_display.add_line, "No XP to remove")
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_set_health_valid(self, mock_input, mock_display):
         """Test setting health with valid input."""
@@ -194,7 +198,6 @@ class TestDebugMenuMethods:
         # Player health should be set to 25
         assert player.current_health == 25
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_set_strength_valid(self, mock_input, mock_display):
         """Test setting strength with valid input."""
@@ -208,7 +211,6 @@ class TestDebugMenuMethods:
         # Player strength should be set to 15
         assert player.strength == 15
     
-    @patch('src.ui.display.display')
     def test_toggle_debug_mode_on(self, mock_display):
         """Test toggling debug mode on."""
         debug_menu = DebugMenu()
@@ -222,11 +224,8 @@ class TestDebugMenuMethods:
         assert mock_display.debug_mode is True
         
         # Should show debug mode ON message
-        on_calls = [call for call in mock_display.add_line.call_args_list 
-                   if any("DEBUG MODE: ON" in str(arg) for arg in call[0])]
-        assert len(on_calls) > 0
+        assert _saw(mock_display.add_line, "DEBUG MODE: ON")
     
-    @patch('src.ui.display.display')
     def test_toggle_debug_mode_off(self, mock_display):
         """Test toggling debug mode off."""
         debug_menu = DebugMenu()
@@ -240,47 +239,38 @@ class TestDebugMenuMethods:
         assert mock_display.debug_mode is False
         
         # Should show debug mode OFF message
-        off_calls = [call for call in mock_display.add_line.call_args_list 
-                    if any("DEBUG MODE: OFF" in str(arg) for arg in call[0])]
-        assert len(off_calls) > 0
+        assert _saw(mock_display.add_line, "DEBUG MODE: OFF")
 
 
 class TestDebugMenuNavigation:
     """Test debug menu navigation and flow."""
     
-    @patch('src.ui.display.display')
-    @patch('builtins.input')
-    def test_show_debug_menu_quit(self, mock_input, mock_display):
+    def test_show_debug_menu_quit(self, mock_display):
         """Test quitting from debug menu."""
         debug_menu = DebugMenu()
         player = Player("Test Hero", level=2, experience=50)
         
-        mock_input.return_value = "8"  # Back to Inn option
+        mock_display.display_menu.return_value = "8"  # Back to Inn option
         
         result = debug_menu.show_debug_menu(player)
         
         assert result == "continue"
     
-    @patch('src.ui.display.display')
-    @patch('builtins.input')
-    def test_show_debug_menu_invalid_choice(self, mock_input, mock_display):
+    def test_show_debug_menu_invalid_choice(self, mock_display):
         """Test invalid menu choice handling."""
         debug_menu = DebugMenu()
         player = Player("Test Hero", level=2, experience=50)
         
         # First invalid, then quit
-        mock_input.side_effect = ["99", "8"]
+        mock_display.display_menu.side_effect = ["99", "8"]
         
         result = debug_menu.show_debug_menu(player)
         
         assert result == "continue"
         
         # Should show invalid choice message
-        error_calls = [call for call in mock_display.add_line.call_args_list 
-                      if any("Invalid choice" in str(arg) for arg in call[0])]
-        assert len(error_calls) > 0
+        assert _saw(mock_display.add_line, "Invalid choice")
     
-    @patch('src.ui.display.display')
     def test_debug_menu_status_display(self, mock_display):
         """Test that debug menu shows player status."""
         debug_menu = DebugMenu()
@@ -304,7 +294,6 @@ class TestDebugMenuNavigation:
 class TestDebugMenuInputHandling:
     """Test debug menu input validation and error handling."""
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_keyboard_interrupt_handling(self, mock_input, mock_display):
         """Test handling of keyboard interrupts in debug methods."""
@@ -317,13 +306,10 @@ class TestDebugMenuInputHandling:
         try:
             debug_menu._add_level(player)
             # Should show operation cancelled message
-            cancel_calls = [call for call in mock_display.add_line.call_args_list 
-                           if any("Operation cancelled" in str(arg) for arg in call[0])]
-            assert len(cancel_calls) > 0
+            assert _saw(mock_display.add_line, "Operation cancelled")
         except KeyboardInterrupt:
             assert False, "KeyboardInterrupt should be handled gracefully"
     
-    @patch('src.ui.display.display')
     @patch('builtins.input')
     def test_eof_error_handling(self, mock_input, mock_display):
         """Test handling of EOF errors in debug methods."""
@@ -336,9 +322,7 @@ class TestDebugMenuInputHandling:
         try:
             debug_menu._add_xp(player)
             # Should show operation cancelled message
-            cancel_calls = [call for call in mock_display.add_line.call_args_list 
-                           if any("Operation cancelled" in str(arg) for arg in call[0])]
-            assert len(cancel_calls) > 0
+            assert _saw(mock_display.add_line, "Operation cancelled")
         except EOFError:
             assert False, "EOFError should be handled gracefully"
 
@@ -366,7 +350,7 @@ class TestDebugMenuIntegration:
         initial_strength = player.strength
         
         # Simulate debug modifications
-        with patch('builtins.input'), patch('src.ui.display.display'):
+        with patch('builtins.input'):
             # These would normally be called through the menu
             player.level += 2  # Simulate add level
             player.experience += 100  # Simulate add XP  
@@ -379,7 +363,6 @@ class TestDebugMenuIntegration:
         assert player.current_health == initial_health - 10
         assert player.strength == initial_strength + 5
     
-    @patch('src.ui.display.display')
     def test_debug_delay_consistency(self, mock_display):
         """Test that debug menu uses consistent delays."""
         debug_menu = DebugMenu()
@@ -393,8 +376,6 @@ class TestDebugMenuIntegration:
         with patch('builtins.input', return_value="5"):
             debug_menu._add_level(player)
         
-        # Check that add_line was called with debug delay
-        delay_calls = [call for call in mock_display.add_line.call_args_list 
-                      if len(call[1]) > 0 and 'delay' in call[1] and 
-                      call[1]['delay'] == debug_menu.debug_delay]
-        assert len(delay_calls) > 0
\ No newline at end of file
+        # Every line should be passed the debug delay as a keyword argument
+        delays = {c.kwargs.get('delay') for c in mock_display.add_line.call_args_list}
+        assert delays == {debug_menu.debug_delay}
@@ -5,9 +5,9 @@ Tests console display functionality, text scrolling, and menu systems.
 """
 
 import pytest
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, patch
 import io
-import sys
+import os
 from src.ui.display import Display
 
 
@@ -24,6 +24,14 @@ class TestDisplaySystem:
         assert display.line_delay == 0.3
         assert display.exposition_line_delay == 0.8
     
+    def test_display_attributes_use_slots(self):
+        """Test that the display's state lives in slots, not the instance dict."""
+        display = Display()
+        
+        assert vars(display) == {}
+        assert display.content_lines is not None
+        assert display.get_line_delay() == 0.3
+    
     def test_debug_mode_toggle(self):
         """Test debug mode functionality."""
         display = Display()
@@ -83,6 +91,42 @@ class TestDisplaySystem:
         display.add_line("No delay line", delay=None)
         mock_sleep.assert_not_called()
     
+    @patch('time.sleep')
+    def test_add_line_zero_delay(self, mock_sleep):
+        """Test add_line with delay=0 (no sleep, even in debug mode)."""
+        display = Display()
+        display.debug_mode = True
+        
+        display.add_line("Zero delay line", delay=0)
+        mock_sleep.assert_not_called()
+    
+    def test_add_line_quiet_skips_refresh(self):
+        """Test that quiet lines are added without redrawing."""
+        display = Display()
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            display.add_line("First", quiet=True)
+            display.add_line("Second", quiet=True)
+        
+        mock_refresh.assert_not_called()
+        assert list(display.content_lines)[-2:] == ["First", "Second"]
+    
+    @patch('time.sleep')
+    def test_pause_ends_early_on_typed_input(self, mock_sleep):
+        """Test that a pause returns at once when input is waiting on the terminal."""
+        display = Display()
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, b"1\n")
+            display._stdin_fd = read_fd
+            
+            display._pause(30)  # Would hang the test if it waited
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        
+        mock_sleep.assert_not_called()
+    
     def test_add_lines_list(self):
         """Test adding multiple lines at once."""
         display = Display()
@@ -103,9 +147,74 @@ class TestDisplaySystem:
         lines = ["First", "Second"]
         display.add_lines(lines, delay=0.2)
         
-        # Should call sleep for each line
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_has_calls([call(0.2), call(0.2)])
+        # One pause covering both lines
+        mock_sleep.assert_called_once_with(pytest.approx(0.4))
+    
+    @patch('time.sleep')
+    def test_add_lines_refreshes_and_sleeps_once(self, mock_sleep):
+        """Test that add_lines draws once and pauses once, extra sleep included."""
+        display = Display()
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            display.add_lines(["First", "Second", "Third"], delay=0.1, sleep=0.5)
+        
+        assert mock_refresh.call_count == 1
+        mock_sleep.assert_called_once_with(pytest.approx(0.8))
+        assert list(display.content_lines)[-3:] == ["First", "Second", "Third"]
+    
+    @patch('time.sleep')
+    def test_add_lines_skips_none(self, mock_sleep):
+        """Test that None entries are dropped and not counted toward the pause."""
+        display = Display()
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            display.add_lines(["First", None, "Second"], delay=0.2)
+        
+        assert mock_refresh.call_count == 1
+        mock_sleep.assert_called_once_with(pytest.approx(0.4))
+        assert list(display.content_lines)[-2:] == ["First", "Second"]
+    
+    @patch('time.sleep')
+    def test_add_lines_in_batch_does_not_sleep(self, mock_sleep):
+        """Test that add_lines inside batch() neither draws nor pauses until the block ends."""
+        display = Display()
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            with display.batch():
+                display.add_lines(["First", "Second"], delay=0.2)
+                assert mock_refresh.call_count == 0
+        
+        assert mock_refresh.call_count == 1
+        mock_sleep.assert_not_called()
+        assert list(display.content_lines)[-2:] == ["First", "Second"]
+    
+    def test_batch_refreshes_once(self):
+        """Test that lines added inside batch() trigger a single refresh."""
+        display = Display()
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            with display.batch():
+                display.add_line("First")
+                display.add_line("Second")
+                display.add_line("Third")
+                assert mock_refresh.call_count == 0
+        
+        assert mock_refresh.call_count == 1
+        assert list(display.content_lines)[-3:] == ["First", "Second", "Third"]
+    
+    def test_content_area_fits_terminal(self):
+        """Test that the content area is sized to the terminal and stays bounded."""
+        with patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 30))):
+            display = Display()
+        
+        assert display.window_height == 23  # 30 rows minus header, footer and prompt
+        
+        with patch.object(display, 'refresh_display'):
+            for i in range(100):
+                display.add_line(f"Line {i}")
+        
+        assert len(display.content_lines) == 23
+        assert display.content_lines[-1] == "Line 99"
     
     def test_set_footer(self):
         """Test setting the footer text."""
@@ -131,47 +240,137 @@ class TestDisplaySystem:
         assert display.lines == []
         assert display.footer == ""
     
-    @patch('builtins.print')
+    @patch('sys.stdout')
     @patch('os.system')
-    def test_refresh_display_windows(self, mock_system, mock_print):
-        """Test display refresh on Windows."""
-        display = Display()
+    def test_refresh_display_windows(self, mock_system, mock_stdout):
+        """Test display refresh on a Windows console without ANSI support."""
+        with patch('os.name', 'nt'), \
+                patch.object(Display, '_enable_vt_mode', return_value=False):
+            display = Display()
         
-        display.add_line("Test content")
+        display.content_lines.append("Test content")
         display.set_footer("Test footer")
+        display.refresh_display()
         
-        with patch('sys.platform', 'win32'):
-            display.refresh_display()
-        
-        # Should clear screen and print content
+        # Should fall back to cls, then write the frame
         mock_system.assert_called_once_with('cls')
-        assert mock_print.called
+        mock_stdout.write.assert_called_once()
+        assert "  Test content" in mock_stdout.write.call_args.args[0]
     
-    @patch('builtins.print')
+    @patch('sys.stdout')
     @patch('os.system')  
-    def test_refresh_display_unix(self, mock_system, mock_print):
+    def test_refresh_display_unix(self, mock_system, mock_stdout):
         """Test display refresh on Unix systems."""
         display = Display()
         
-        display.add_line("Test content")
+        display.content_lines.append("Test content")
+        display.refresh_display()
+        
+        # Clear and frame go out together in one write, without a shell
+        mock_system.assert_not_called()
+        mock_stdout.write.assert_called_once()
+        frame = mock_stdout.write.call_args.args[0]
+        assert frame.startswith("\x1b[2J\x1b[H")
+        assert "  Test content" in frame
+    
+    @patch('os.system')
+    def test_refresh_display_writes_to_redirected_stdout(self, mock_system):
+        """Test that a refresh goes through sys.stdout when it is redirected."""
+        display = Display()
+        display.content_lines.append("Test content")
+        display.set_footer("Test footer")
+        
+        buffer = io.StringIO()
+        with patch('sys.stdout', buffer):
+            display.refresh_display()
         
-        with patch('sys.platform', 'linux'):
+        frame = buffer.getvalue()
+        assert "  Test content" in frame
+        assert "Test footer" in frame
+        assert frame.startswith("\x1b[2J\x1b[H" + "=" * display.ui_width + "\n")
+    
+    @patch('os.system')
+    def test_refresh_display_non_string_lines(self, mock_system):
+        """Test that non-string content lines are rendered with str()."""
+        display = Display()
+        display.content_lines.append(None)
+        display.content_lines.append(42)
+        
+        buffer = io.StringIO()
+        with patch('sys.stdout', buffer):
             display.refresh_display()
         
-        # Should clear screen with 'clear' command
-        mock_system.assert_called_once_with('clear')
-        assert mock_print.called
+        frame = buffer.getvalue()
+        assert "  None" in frame
+        assert "  42" in frame
+    
+    @patch('os.system')
+    def test_refresh_display_matches_header_and_footer(self, mock_system):
+        """Test that a refresh draws the same header and footer as print_header/print_footer."""
+        display = Display()
+        display.set_header("Title")
+        
+        buffer = io.StringIO()
+        with patch('sys.stdout', buffer):
+            display.refresh_display()
+        
+        frame = buffer.getvalue()
+        assert frame.startswith("\x1b[2J\x1b[H" + display._render_header())
+        assert frame.endswith(display._render_footer())
+        assert frame.endswith(("=" * display.ui_width + "\n") * 2)
+    
+    @patch('os.system')
+    def test_refresh_display_reuses_unchanged_content(self, mock_system):
+        """Test that the content area is only rebuilt after lines change."""
+        display = Display()
+        
+        with patch.object(display, '_write_frame'), \
+                patch.object(display, '_render_content', wraps=display._render_content) as mock_render:
+            display.refresh_display()
+            display.set_footer("New footer")
+            display.refresh_display()
+            assert mock_render.call_count == 1
+            
+            display.add_line("New line")
+            assert mock_render.call_count == 2
+    
+    @patch('os.system')
+    def test_footer_rendered_when_set(self, mock_system):
+        """Test that the footer bars are built when the footer changes, not per refresh."""
+        display = Display()
+        display.set_footer("Choose wisely")
+        
+        with patch.object(display, '_write_frame'), \
+                patch.object(display, '_render_footer') as mock_render:
+            display.refresh_display()
+            display.print_footer()
+        
+        mock_render.assert_not_called()
+        assert b"Choose wisely" in display._footer_bytes
+    
+    @patch('os.system')
+    def test_refresh_display_redraws_unchanged_frame(self, mock_system):
+        """Test that an identical frame is still redrawn (other output may have moved it)."""
+        display = Display()
+        display.set_footer("Footer")
+        
+        with patch.object(display, '_write_frame') as mock_write:
+            display.refresh_display()
+            display.refresh_display()
+        
+        assert mock_write.call_count == 2
+        assert mock_write.call_args_list[0] == mock_write.call_args_list[1]
 
 
 class TestDisplayMenu:
     """Test the display menu system."""
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_basic(self, mock_refresh, mock_input):
+    def test_display_menu_basic(self, mock_refresh, mock_stdin):
         """Test basic menu display and input."""
         display = Display()
-        mock_input.return_value = "1"
+        mock_stdin.readline.return_value = "1\n"
         
         options = ["Option 1", "Option 2", "Option 3"]
         result = display.display_menu("Test Menu", options, "Status text")
@@ -179,12 +378,12 @@ class TestDisplayMenu:
         assert result == "1"
         assert mock_refresh.called
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_with_exposition(self, mock_refresh, mock_input):
+    def test_display_menu_with_exposition(self, mock_refresh, mock_stdin):
         """Test menu with exposition intro."""
         display = Display()
-        mock_input.return_value = "2"
+        mock_stdin.readline.return_value = "2\n"
         
         options = ["Choice A", "Choice B"]
         
@@ -193,52 +392,114 @@ class TestDisplayMenu:
         
         assert result == "2"
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_quit_command(self, mock_refresh, mock_input):
+    def test_display_menu_quit_command(self, mock_refresh, mock_stdin):
         """Test menu quit command handling."""
         display = Display()
-        mock_input.return_value = "quit"
+        mock_stdin.readline.return_value = "quit\n"
         
         options = ["Option 1", "Option 2"]
         result = display.display_menu("Test Menu", options, "Status")
         
         assert result == "quit"
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_invalid_then_valid(self, mock_refresh, mock_input):
+    def test_display_menu_invalid_then_valid(self, mock_refresh, mock_stdin):
         """Test menu with invalid input followed by valid input."""
         display = Display()
         
-        # First return invalid, then valid
-        mock_input.side_effect = ["invalid", "1"]
+        # First return invalid, then valid, noting the refresh count at each read
+        answers = iter(["invalid\n", "1\n"])
+        refreshes_at_read = []
+        def readline():
+            refreshes_at_read.append(mock_refresh.call_count)
+            return next(answers)
+        mock_stdin.readline.side_effect = readline
         
         options = ["Valid Option"]
-        result = display.display_menu("Test Menu", options, "Status")
+        buffer = io.StringIO()
+        with patch('sys.stdout', buffer):
+            result = display.display_menu("Test Menu", options, "Status")
         
         assert result == "1"
         # Should have been called twice due to invalid input
-        assert mock_input.call_count == 2
+        assert mock_stdin.readline.call_count == 2
+        # The error goes on the prompt line without redrawing the menu
+        assert refreshes_at_read[0] == refreshes_at_read[1]
+        # Back up onto the prompt row the echoed Enter moved off, then rewrite it
+        assert buffer.getvalue() == "\x1b[1A\r\x1b[KPlease choose a number between 1 and 1: "
+    
+    @patch('sys.stdin')
+    @patch('src.ui.display.Display.refresh_display')
+    def test_display_menu_invalid_redraws_without_ansi(self, mock_refresh, mock_stdin):
+        """Test that consoles without escape support redraw the menu on bad input."""
+        display = Display()
+        display._ansi_clear = False
+        
+        answers = iter(["invalid\n", "1\n"])
+        refreshes_at_read = []
+        def readline():
+            refreshes_at_read.append(mock_refresh.call_count)
+            return next(answers)
+        mock_stdin.readline.side_effect = readline
+        
+        buffer = io.StringIO()
+        with patch('sys.stdout', buffer):
+            result = display.display_menu("Test Menu", ["Valid Option"], "Status")
+        
+        assert result == "1"
+        # One full redraw for the invalid entry, then the error as the prompt
+        assert refreshes_at_read[1] == refreshes_at_read[0] + 1
+        assert buffer.getvalue() == "Please choose a number between 1 and 1: "
+    
+    @patch('sys.stdin')
+    @patch('src.ui.display.Display.refresh_display')
+    def test_display_menu_single_keypress(self, mock_refresh, mock_stdin):
+        """Test that on a terminal a digit key is taken without waiting for Enter."""
+        display = Display()
+        
+        with patch.object(display, '_can_read_keys', return_value=True), \
+                patch.object(display, '_read_key', return_value="2"), \
+                patch('sys.stdout', io.StringIO()):
+            result = display.display_menu("Test Menu", ["Option 1", "Option 2"], "Status")
+        
+        assert result == "2"
+        mock_stdin.readline.assert_not_called()
+    
+    @patch('sys.stdin')
+    @patch('src.ui.display.Display.refresh_display')
+    def test_display_menu_single_key_falls_back_to_line(self, mock_refresh, mock_stdin):
+        """Test that a non-digit first key is completed as a full line, e.g. quit."""
+        display = Display()
+        mock_stdin.readline.return_value = "uit\n"
+        
+        with patch.object(display, '_can_read_keys', return_value=True), \
+                patch.object(display, '_read_key', return_value="q"), \
+                patch('sys.stdout', io.StringIO()):
+            result = display.display_menu("Test Menu", ["Option 1", "Option 2"], "Status")
+        
+        assert result == "quit"
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_keyboard_interrupt(self, mock_refresh, mock_input):
+    def test_display_menu_keyboard_interrupt(self, mock_refresh, mock_stdin):
         """Test menu handling of keyboard interrupt."""
         display = Display()
-        mock_input.side_effect = KeyboardInterrupt()
+        mock_stdin.readline.side_effect = KeyboardInterrupt()
         
         options = ["Option 1"]
         result = display.display_menu("Test Menu", options, "Status")
         
         assert result == "quit"
     
-    @patch('builtins.input')
+    @patch('sys.stdin')
     @patch('src.ui.display.Display.refresh_display')
-    def test_display_menu_eof_error(self, mock_refresh, mock_input):
+    def test_display_menu_eof_error(self, mock_refresh, mock_stdin):
         """Test menu handling of EOF error."""
         display = Display()
-        mock_input.side_effect = EOFError()
+        mock_stdin.readline.return_value = ""  # End of input
         
         options = ["Option 1"]
         result = display.display_menu("Test Menu", options, "Status")
@@ -256,7 +517,7 @@ class TestDisplayFormatting:
         options = ["First Option", "Second Option", "Third Option"]
         
         # This tests internal formatting - we'll check via display_menu
-        with patch('builtins.input', return_value="1"):
+        with patch('sys.stdin', io.StringIO("1\n")):
             with patch.object(display, 'refresh_display'):
                 display.display_menu("Test", options, "Status")
         
@@ -269,7 +530,7 @@ class TestDisplayFormatting:
         
         options = ["Alpha", "Beta", "Gamma"]
         
-        with patch('builtins.input', return_value="2"):
+        with patch('sys.stdin', io.StringIO("2\n")):
             with patch.object(display, 'refresh_display'):
                 display.display_menu("Test", options, "Status")
         
@@ -285,7 +546,7 @@ class TestDisplayFormatting:
         
         status_text = "Important status information"
         
-        with patch('builtins.input', return_value="1"):
+        with patch('sys.stdin', io.StringIO("1\n")):
             with patch.object(display, 'refresh_display'):
                 display.display_menu("Test", ["Option"], status_text)
         
@@ -294,6 +555,53 @@ class TestDisplayFormatting:
         assert status_text in all_content
 
 
+class TestDisplayHeader:
+    """Test the dynamic HP header."""
+    
+    def test_dynamic_header_reflects_health_changes(self):
+        """Test that the cached header is rebuilt when HP changes."""
+        display = Display()
+        player = Mock(emoji="🧙", current_health=50, max_health=100)
+        player.name = "Hero"
+        display.set_header("COMBAT")
+        display.set_player_for_header(player)
+        
+        assert display.get_dynamic_header() == "COMBAT | 🧙 Hero: 50/100 HP"
+        
+        player.current_health = 40
+        assert display.get_dynamic_header() == "COMBAT | 🧙 Hero: 40/100 HP"
+    
+    def test_dynamic_header_reflects_monster_health(self):
+        """Test that the monster icon updates as the monster is damaged."""
+        display = Display()
+        player = Mock(emoji="🧙", current_health=50, max_health=100)
+        player.name = "Hero"
+        monster = Mock(current_health=20, max_health=20)
+        monster.name = "Goblin"
+        display.set_header("COMBAT")
+        display.set_player_for_header(player)
+        display.set_monster_for_header(monster)
+        
+        assert display.get_dynamic_header().endswith("🐉 Goblin 💚")
+        
+        monster.current_health = 2
+        assert display.get_dynamic_header().endswith("🐉 Goblin 💀")
+    
+    def test_show_hp_in_header_requires_player(self):
+        """Test that the HP header is off while no player is set."""
+        display = Display()
+        display.set_header("INN")
+        display.show_hp_in_header = True
+        
+        assert display.show_hp_in_header is False
+        assert display.get_dynamic_header() == "INN"
+        
+        display.set_player_for_header(Mock(emoji="🧙", current_health=5, max_health=10))
+        assert display.show_hp_in_header is True
+        display.clear_hp_header()
+        assert display.show_hp_in_header is False
+
+
 class TestDisplayDelays:
     """Test display delay functionality."""
     
@@ -329,6 +637,21 @@ class TestDisplayDelays:
         delay = display.get_exposition_delay()
         assert delay == 0.05  # Debug mode faster delay
     
+    def test_delays_follow_later_changes(self):
+        """Test that delays changed after toggling debug mode still take effect."""
+        display = Display()
+        
+        display.line_delay = 0.1
+        assert display.get_line_delay() == 0.1
+        
+        display.debug_mode = True
+        display.debug_delay = 0.01
+        assert display.get_line_delay() == 0.01
+        assert display.get_exposition_delay() == 0.01
+        
+        display.debug_mode = False
+        assert display.get_line_delay() == 0.1
+    
     @patch('time.sleep')
     def test_delay_application_normal_mode(self, mock_sleep):
         """Test that delays are applied correctly in normal mode."""
@@ -346,6 +669,17 @@ class TestDisplayDelays:
         
         display.add_line("Test line", delay=0.5)
         mock_sleep.assert_called_once_with(0.05)
+    
+    @patch('time.sleep')
+    def test_zero_debug_delay_skips_sleep(self, mock_sleep):
+        """Test that a debug delay of 0 turns pauses off instead of using the normal delay."""
+        display = Display()
+        display.debug_mode = True
+        display.debug_delay = 0
+        
+        display.add_line("Test line", delay=0.5)
+        display.add_lines(["First", "Second"], delay=0.5, sleep=1.0)
+        mock_sleep.assert_not_called()
 
 
 class TestDisplayIntegration:
@@ -362,11 +696,11 @@ class TestDisplayIntegration:
         display.add_line("Test singleton")
         assert "Test singleton" in display.lines
     
-    @patch('builtins.input')
-    def test_complete_menu_interaction(self, mock_input):
+    @patch('sys.stdin')
+    def test_complete_menu_interaction(self, mock_stdin):
         """Test a complete menu interaction scenario."""
         display = Display()
-        mock_input.return_value = "2"
+        mock_stdin.readline.return_value = "2\n"
         
         options = ["Go to forest", "Rest at inn", "Check stats"]
         status = "You are at the village square."
@@ -394,6 +728,20 @@ class TestDisplayIntegration:
             # If an exception occurs, it should be handled gracefully
             assert False, "Display methods should handle None values gracefully"
     
+    def test_none_values_are_ignored(self):
+        """Test that None lines are skipped and a None footer clears the footer."""
+        display = Display()
+        display.set_footer("Footer")
+        before = list(display.content_lines)
+        
+        with patch.object(display, 'refresh_display') as mock_refresh:
+            display.add_line(None)
+            display.set_footer(None)
+        
+        mock_refresh.assert_not_called()
+        assert list(display.content_lines) == before
+        assert display.footer_text == ""
+    
     def test_large_content_handling(self):
         """Test display with large amounts of content."""
         display = Display()
@@ -5,8 +5,63 @@ Tests equipment classes, inventory management, and equipped items functionality.
 """
 
 import pytest
-from src.equipment import Equipment, Weapon, Armor, Accessory, Inventory, EquippedItems
-from src.equipment.equipment import EquipmentSlot, create_basic_sword, create_basic_armor, create_basic_ring
+from src.equipment import Equipment, Weapon, Armor, Accessory, EquippedItems
+from src.equipment.equipment import EquipmentSlot
+
+pytestmark = pytest.mark.equipment
+
+_SLOTS = tuple(EquipmentSlot)
+
+ARMOR_VALID = frozenset({
+    EquipmentSlot.HEAD,
+    EquipmentSlot.BODY,
+    EquipmentSlot.LEGS,
+    EquipmentSlot.HANDS,
+    EquipmentSlot.FEET,
+})
+ACCESSORY_VALID = frozenset({
+    EquipmentSlot.NECKLACE,
+    EquipmentSlot.RING_1,
+    EquipmentSlot.RING_2,
+})
+
+# Invalid slots are the complement of the valid ones; iterate in enum
+# order so parametrize ids match across xdist workers
+ARMOR_VALID_SLOTS = tuple(slot for slot in _SLOTS if slot in ARMOR_VALID)
+ARMOR_INVALID_SLOTS = tuple(slot for slot in _SLOTS if slot not in ARMOR_VALID)
+ACCESSORY_VALID_SLOTS = tuple(slot for slot in _SLOTS if slot in ACCESSORY_VALID)
+ACCESSORY_INVALID_SLOTS = tuple(slot for slot in _SLOTS if slot not in ACCESSORY_VALID)
+
+# Pieces create_basic_armor() must provide
+_ARMOR_SET_KEYS = frozenset({'head', 'body', 'legs'})
+
+
+def _summary_parts(summary):
+    """Split a get_stat_summary() string into its individual stat entries."""
+    return frozenset(summary.split(" | "))
+
+
+@pytest.fixture(scope="module")
+def lvl10_item():
+    """Build one level-10 item shared by the can_equip cases."""
+    return Equipment("High Level Item", level_requirement=10)
+
+
+@pytest.fixture
+def populated_equipped(request):
+    """Build EquippedItems with the parametrized items already equipped."""
+    equipped = EquippedItems()
+    for item in request.param:
+        equipped.equip_item(item)
+    return equipped
+
+
+# (items to pre-equip, slot to unequip)
+_UNEQUIP_CASES = [
+    ((Weapon("Iron Sword", damage=5),), EquipmentSlot.MAIN_HAND),
+    ((Armor("Helmet", "Iron", EquipmentSlot.HEAD, defense_bonus=3),), EquipmentSlot.HEAD),
+    ((Accessory("Ring", "Ring", EquipmentSlot.RING_1),), EquipmentSlot.RING_1),
+]
 
 
 class TestEquipmentBaseClass:
@@ -52,9 +107,9 @@ class TestEquipmentBaseClass:
         equipment = Equipment("Stat Item", strength_bonus=5, health_bonus=10, defense_bonus=2)
         summary = equipment.get_stat_summary()
         
-        assert "STR: +5" in summary
-        assert "HP: +10" in summary
-        assert "DEF: +2" in summary
+        expected = {"STR: +5", "HP: +10", "DEF: +2"}
+        parts = _summary_parts(summary)
+        assert expected <= parts, f"missing: {expected - parts}"
     
     def test_stat_summary_no_bonuses(self):
         """Test stat summary with no bonuses."""
@@ -68,17 +123,30 @@ class TestEquipmentBaseClass:
         equipment = Equipment("Cursed Item", strength_bonus=-2, health_bonus=-5)
         summary = equipment.get_stat_summary()
         
-        assert "STR: -2" in summary
-        assert "HP: -5" in summary
+        expected = {"STR: -2", "HP: -5"}
+        parts = _summary_parts(summary)
+        assert expected <= parts, f"missing: {expected - parts}"
     
-    def test_can_equip_level_requirement(self):
-        """Test level requirement checking."""
-        equipment = Equipment("High Level Item", level_requirement=10)
+    def test_stat_summary_is_cached(self):
+        """Test repeated summaries reuse the string until a bonus changes."""
+        equipment = Equipment("Stat Item", strength_bonus=5)
+        summary1 = equipment.get_stat_summary()
+        summary2 = equipment.get_stat_summary()
         
-        assert equipment.can_equip(10) is True
-        assert equipment.can_equip(15) is True
-        assert equipment.can_equip(5) is False
-        assert equipment.can_equip(1) is False
+        assert summary1 is summary2
+        
+        equipment.strength_bonus = 7
+        assert equipment.get_stat_summary() == "STR: +7"
+    
+    @pytest.mark.parametrize("level,expected", [
+        (10, True),
+        (15, True),
+        (5, False),
+        (1, False),
+    ])
+    def test_can_equip_level_requirement(self, lvl10_item, level, expected):
+        """Test level requirement checking."""
+        assert lvl10_item.can_equip(level) == expected
     
     def test_string_representation(self):
         """Test equipment string representation."""
@@ -142,9 +210,17 @@ class TestWeaponClass:
         weapon = Weapon("Magic Sword", damage=12, strength_bonus=3, health_bonus=5)
         summary = weapon.get_stat_summary()
         
-        assert "DMG: +12" in summary
-        assert "STR: +3" in summary
-        assert "HP: +5" in summary
+        expected = {"DMG: +12", "STR: +3", "HP: +5"}
+        parts = _summary_parts(summary)
+        assert expected <= parts, f"missing: {expected - parts}"
+    
+    def test_weapon_stat_summary_tracks_damage(self):
+        """Test the cached weapon summary is rebuilt when damage changes."""
+        weapon = Weapon("Sword", damage=7)
+        assert weapon.get_stat_summary() == "DMG: +7"
+        
+        weapon.damage = 9
+        assert weapon.get_stat_summary() == "DMG: +9"
     
     def test_weapon_damage_only(self):
         """Test weapon with only damage bonus."""
@@ -167,33 +243,17 @@ class TestArmorClass:
         assert helmet.defense_bonus == 5
         assert helmet.value == 30
     
-    def test_armor_valid_slots(self):
+    @pytest.mark.parametrize("slot", ARMOR_VALID_SLOTS)
+    def test_armor_valid_slots(self, slot):
         """Test armor creation for all valid armor slots."""
-        valid_slots = [
-            EquipmentSlot.HEAD,
-            EquipmentSlot.BODY, 
-            EquipmentSlot.LEGS,
-            EquipmentSlot.HANDS,
-            EquipmentSlot.FEET
-        ]
-        
-        for slot in valid_slots:
-            armor = Armor(f"Test {slot.value}", "Leather", slot)
-            assert armor.get_slot() == slot
-    
-    def test_armor_invalid_slots(self):
+        armor = Armor(f"Test {slot.value}", "Leather", slot)
+        assert armor.get_slot() == slot
+    
+    @pytest.mark.parametrize("slot", ARMOR_INVALID_SLOTS)
+    def test_armor_invalid_slots(self, slot):
         """Test that armor can't be created for invalid slots."""
-        invalid_slots = [
-            EquipmentSlot.MAIN_HAND,
-            EquipmentSlot.OFF_HAND,
-            EquipmentSlot.NECKLACE,
-            EquipmentSlot.RING_1,
-            EquipmentSlot.RING_2
-        ]
-        
-        for slot in invalid_slots:
-            with pytest.raises(ValueError):
-                Armor("Invalid Armor", "Leather", slot)
+        with pytest.raises(ValueError):
+            Armor("Invalid Armor", "Leather", slot)
 
 
 class TestAccessoryClass:
@@ -211,210 +271,151 @@ class TestAccessoryClass:
         assert necklace.value == 75
         assert necklace.rarity == "Uncommon"
     
-    def test_accessory_valid_slots(self):
+    @pytest.mark.parametrize("slot", ACCESSORY_VALID_SLOTS)
+    def test_accessory_valid_slots(self, slot):
         """Test accessory creation for all valid accessory slots."""
-        valid_slots = [
-            EquipmentSlot.NECKLACE,
-            EquipmentSlot.RING_1,
-            EquipmentSlot.RING_2
-        ]
-        
-        for slot in valid_slots:
-            accessory = Accessory(f"Test {slot.value}", "Ring", slot)
-            assert accessory.get_slot() == slot
+        accessory = Accessory(f"Test {slot.value}", "Ring", slot)
+        assert accessory.get_slot() == slot
     
-    def test_accessory_invalid_slots(self):
+    @pytest.mark.parametrize("slot", ACCESSORY_INVALID_SLOTS)
+    def test_accessory_invalid_slots(self, slot):
         """Test that accessories can't be created for invalid slots."""
-        invalid_slots = [
-            EquipmentSlot.MAIN_HAND,
-            EquipmentSlot.HEAD,
-            EquipmentSlot.BODY,
-            EquipmentSlot.LEGS,
-            EquipmentSlot.HANDS,
-            EquipmentSlot.FEET
-        ]
-        
-        for slot in invalid_slots:
-            with pytest.raises(ValueError):
-                Accessory("Invalid Accessory", "Ring", slot)
+        with pytest.raises(ValueError):
+            Accessory("Invalid Accessory", "Ring", slot)
 
 
 class TestEquipmentFactories:
     """Test the equipment factory functions."""
     
-    def test_create_basic_sword(self):
+    def test_create_basic_sword(self, basic_sword_template):
         """Test basic sword creation."""
-        sword = create_basic_sword()
-        
-        assert isinstance(sword, Weapon)
-        assert sword.name == "Iron Sword"
-        assert sword.damage == 5
-        assert sword.weapon_type == "Sword"
-        assert sword.rarity == "Common"
+        assert isinstance(basic_sword_template, Weapon)
+        assert basic_sword_template.name == "Iron Sword"
+        assert basic_sword_template.damage == 5
+        assert basic_sword_template.weapon_type == "Sword"
+        assert basic_sword_template.rarity == "Common"
     
-    def test_create_basic_armor(self):
+    def test_create_basic_armor(self, basic_armor_template):
         """Test basic armor set creation."""
-        armor_set = create_basic_armor()
-        
-        assert isinstance(armor_set, dict)
-        assert 'head' in armor_set
-        assert 'body' in armor_set
-        assert 'legs' in armor_set
+        assert isinstance(basic_armor_template, dict)
+        assert _ARMOR_SET_KEYS <= basic_armor_template.keys()
         
         # Test individual pieces
-        helmet = armor_set['head']
+        helmet = basic_armor_template['head']
         assert isinstance(helmet, Armor)
         assert helmet.slot == EquipmentSlot.HEAD
         assert helmet.armor_type == "Leather"
     
-    def test_create_basic_ring(self):
+    def test_create_basic_ring(self, basic_ring_template):
         """Test basic ring creation."""
-        ring = create_basic_ring()
-        
-        assert isinstance(ring, Accessory)
-        assert ring.name == "Simple Band"
-        assert ring.accessory_type == "Ring"
-        assert ring.slot == EquipmentSlot.RING_1
-        assert ring.rarity == "Common"
+        assert isinstance(basic_ring_template, Accessory)
+        assert basic_ring_template.name == "Simple Band"
+        assert basic_ring_template.accessory_type == "Ring"
+        assert basic_ring_template.slot == EquipmentSlot.RING_1
+        assert basic_ring_template.rarity == "Common"
 
 
 class TestInventoryClass:
     """Test the Inventory management system."""
     
-    def test_inventory_creation(self):
+    def test_inventory_creation(self, make_inventory):
         """Test inventory creation with custom capacity."""
-        inventory = Inventory(max_capacity=10)
+        inventory = make_inventory(10)
         
         assert inventory.max_capacity == 10
         assert inventory.get_count() == 0
-        assert inventory.is_empty() is True
-        assert inventory.is_full() is False
+        assert inventory.is_empty()
+        assert not inventory.is_full()
     
-    def test_inventory_default_capacity(self):
+    def test_inventory_default_capacity(self, inventory):
         """Test inventory creation with default capacity."""
-        inventory = Inventory()
-        
         assert inventory.max_capacity == 50
     
-    def test_add_item_success(self):
+    def test_add_item_success(self, make_inventory, basic_sword):
         """Test adding items to inventory."""
-        inventory = Inventory(max_capacity=5)
-        sword = create_basic_sword()
+        inventory = make_inventory(5)
         
-        success, message = inventory.add_item(sword)
+        success, message = inventory.add_item(basic_sword)
         
-        assert success is True
+        assert success
         assert "Added Iron Sword to inventory" in message
         assert inventory.get_count() == 1
-        assert inventory.is_empty() is False
+        assert not inventory.is_empty()
     
-    def test_add_item_capacity_full(self):
+    def test_add_item_capacity_full(self, make_inventory, basic_sword):
         """Test adding items when inventory is full."""
-        inventory = Inventory(max_capacity=1)
-        sword1 = create_basic_sword()
+        inventory = make_inventory(1)
         sword2 = Weapon("Second Sword", damage=3)
         
         # Add first item
-        success1, _ = inventory.add_item(sword1)
-        assert success1 is True
-        assert inventory.is_full() is True
+        success1, _ = inventory.add_item(basic_sword)
+        assert success1
+        assert inventory.is_full()
         
         # Try to add second item
         success2, message = inventory.add_item(sword2)
-        assert success2 is False
+        assert not success2
         assert "Inventory full!" in message
     
-    def test_remove_item(self):
+    def test_remove_item(self, inventory_with_sword, basic_sword):
         """Test removing specific items from inventory."""
-        inventory = Inventory()
-        sword = create_basic_sword()
+        assert inventory_with_sword.get_count() == 1
         
-        inventory.add_item(sword)
-        assert inventory.get_count() == 1
-        
-        removed = inventory.remove_item(sword)
-        assert removed is True
-        assert inventory.get_count() == 0
-        assert inventory.is_empty() is True
+        removed = inventory_with_sword.remove_item(basic_sword)
+        assert removed
+        assert inventory_with_sword.get_count() == 0
+        assert inventory_with_sword.is_empty()
     
-    def test_remove_item_not_found(self):
+    def test_remove_item_not_found(self, inventory, basic_sword):
         """Test removing item that's not in inventory."""
-        inventory = Inventory()
-        sword = create_basic_sword()
-        
-        removed = inventory.remove_item(sword)
-        assert removed is False
+        removed = inventory.remove_item(basic_sword)
+        assert not removed
     
-    def test_remove_item_by_name(self):
+    def test_remove_item_by_name(self, inventory_with_sword, basic_sword):
         """Test removing items by name."""
-        inventory = Inventory()
-        sword = create_basic_sword()
-        inventory.add_item(sword)
-        
-        removed_item = inventory.remove_item_by_name("Iron Sword")
-        assert removed_item == sword
-        assert inventory.get_count() == 0
+        removed_item = inventory_with_sword.remove_item_by_name("Iron Sword")
+        assert removed_item == basic_sword
+        assert inventory_with_sword.get_count() == 0
     
-    def test_remove_item_by_name_not_found(self):
+    def test_remove_item_by_name_not_found(self, inventory):
         """Test removing item by name when not found."""
-        inventory = Inventory()
-        
         removed_item = inventory.remove_item_by_name("Nonexistent Sword")
         assert removed_item is None
     
-    def test_get_item_by_name(self):
+    def test_get_item_by_name(self, inventory_with_sword, basic_sword):
         """Test getting items by name without removing."""
-        inventory = Inventory()
-        sword = create_basic_sword()
-        inventory.add_item(sword)
-        
-        found_item = inventory.get_item_by_name("Iron Sword")
-        assert found_item == sword
-        assert inventory.get_count() == 1  # Item still in inventory
+        found_item = inventory_with_sword.get_item_by_name("Iron Sword")
+        assert found_item == basic_sword
+        assert inventory_with_sword.get_count() == 1  # Item still in inventory
     
-    def test_get_item_by_index(self):
+    def test_get_item_by_index(self, inventory, basic_sword, basic_ring):
         """Test getting items by index position."""
-        inventory = Inventory()
-        sword = create_basic_sword()
-        ring = create_basic_ring()
+        inventory.add_item(basic_sword)
+        inventory.add_item(basic_ring)
         
-        inventory.add_item(sword)
-        inventory.add_item(ring)
-        
-        # Test 1-based indexing
-        first_item = inventory.get_item_by_index(1)
-        second_item = inventory.get_item_by_index(2)
-        invalid_item = inventory.get_item_by_index(3)
+        # Test 1-based indexing, with index 3 past the end
+        items = [inventory.get_item_by_index(i) for i in (1, 2, 3)]
         
-        assert first_item == sword
-        assert second_item == ring
-        assert invalid_item is None
+        assert items == [basic_sword, basic_ring, None]
     
-    def test_get_items_by_type(self):
+    def test_get_items_by_type(self, inventory, basic_sword, basic_armor, basic_ring):
         """Test filtering items by type."""
-        inventory = Inventory()
-        sword = create_basic_sword()
-        ring = create_basic_ring()
-        armor_set = create_basic_armor()
-        
-        inventory.add_item(sword)
-        inventory.add_item(ring)
-        inventory.add_item(armor_set['head'])
+        inventory.add_item(basic_sword)
+        inventory.add_item(basic_ring)
+        inventory.add_item(basic_armor['head'])
         
         weapons = inventory.get_items_by_type(Weapon)
         accessories = inventory.get_items_by_type(Accessory)
         armor_pieces = inventory.get_items_by_type(Armor)
         
         assert len(weapons) == 1
-        assert sword in weapons
+        assert basic_sword in weapons
         assert len(accessories) == 1
-        assert ring in accessories
+        assert basic_ring in accessories
         assert len(armor_pieces) == 1
     
-    def test_sort_items(self):
+    def test_sort_items(self, inventory):
         """Test inventory sorting by different criteria."""
-        inventory = Inventory()
-        
         # Add items with different values and names
         cheap_sword = Weapon("A-Sword", damage=1, value=10)
         expensive_sword = Weapon("Z-Sword", damage=5, value=100)
@@ -424,17 +425,14 @@ class TestInventoryClass:
         
         # Test sort by name
         inventory.sort_items("name")
-        assert inventory.items[0] == cheap_sword
-        assert inventory.items[1] == expensive_sword
+        assert inventory.items == [cheap_sword, expensive_sword]
         
         # Test sort by value
         inventory.sort_items("value")
-        assert inventory.items[0] == expensive_sword
-        assert inventory.items[1] == cheap_sword
+        assert inventory.items == [expensive_sword, cheap_sword]
     
-    def test_get_total_value(self):
+    def test_get_total_value(self, inventory):
         """Test calculating total inventory value."""
-        inventory = Inventory()
         sword = Weapon("Sword", damage=5, value=50)
         ring = Accessory("Ring", "Ring", EquipmentSlot.RING_1, value=25)
         
@@ -443,17 +441,14 @@ class TestInventoryClass:
         
         assert inventory.get_total_value() == 75
     
-    def test_inventory_display(self):
+    def test_inventory_display(self, inventory, basic_sword):
         """Test inventory display formatting."""
-        inventory = Inventory()
-        
         # Test empty inventory
         display = inventory.get_inventory_display()
         assert "Inventory is empty" in display
         
         # Test with items
-        sword = create_basic_sword()
-        inventory.add_item(sword)
+        inventory.add_item(basic_sword)
         
         display = inventory.get_inventory_display()
         assert "INVENTORY" in display
@@ -469,21 +464,20 @@ class TestEquippedItemsClass:
         equipped = EquippedItems()
         
         # Test all slots are empty initially
-        for slot in EquipmentSlot:
-            assert equipped.is_slot_empty(slot) is True
+        for slot in _SLOTS:
+            assert equipped.is_slot_empty(slot)
             assert equipped.get_equipped_item(slot) is None
     
-    def test_equip_weapon_main_hand(self):
+    def test_equip_weapon_main_hand(self, basic_sword):
         """Test equipping a weapon to main hand."""
         equipped = EquippedItems()
-        sword = create_basic_sword()
         
-        success, message, old_item = equipped.equip_item(sword)
+        success, message, old_item = equipped.equip_item(basic_sword)
         
-        assert success is True
+        assert success
         assert "Equipped Iron Sword to Main Hand" in message
         assert old_item is None
-        assert equipped.get_equipped_item(EquipmentSlot.MAIN_HAND) == sword
+        assert equipped.get_equipped_item(EquipmentSlot.MAIN_HAND) == basic_sword
     
     def test_equip_weapon_off_hand(self):
         """Test equipping a weapon to off hand."""
@@ -493,18 +487,18 @@ class TestEquippedItemsClass:
         
         success, message, old_item = equipped.equip_item(dagger)
         
-        assert success is True
+        assert success
         assert "Off Hand" in message
         assert equipped.get_equipped_item(EquipmentSlot.OFF_HAND) == dagger
     
-    def test_equip_armor_pieces(self):
+    @pytest.mark.integration
+    def test_equip_armor_pieces(self, basic_armor):
         """Test equipping different armor pieces."""
         equipped = EquippedItems()
-        armor_set = create_basic_armor()
         
-        for armor_piece in armor_set.values():
+        for armor_piece in basic_armor.values():
             success, message, old_item = equipped.equip_item(armor_piece)
-            assert success is True
+            assert success
             assert old_item is None
     
     def test_equip_rings(self):
@@ -516,55 +510,50 @@ class TestEquippedItemsClass:
         
         # Equip first ring
         success1, message1, _ = equipped.equip_item(ring1)
-        assert success1 is True
+        assert success1
         assert "Ring 1" in message1
         
         # Equip second ring
         success2, message2, _ = equipped.equip_item(ring2)
-        assert success2 is True
+        assert success2
         assert "Ring 2" in message2
         
         # Check both rings are equipped
         assert equipped.get_equipped_item(EquipmentSlot.RING_1) == ring1
         assert equipped.get_equipped_item(EquipmentSlot.RING_2) == ring2
     
-    def test_equip_replace_existing(self):
+    @pytest.mark.parametrize("populated_equipped", [(Weapon("Iron Sword", damage=5),)],
+                             indirect=True)
+    def test_equip_replace_existing(self, populated_equipped):
         """Test replacing an already equipped item."""
-        equipped = EquippedItems()
-        
-        sword1 = Weapon("Iron Sword", damage=5)
+        sword1 = populated_equipped.get_equipped_item(EquipmentSlot.MAIN_HAND)
         sword2 = Weapon("Steel Sword", damage=8)
         
-        # Equip first sword
-        equipped.equip_item(sword1)
-        
         # Equip second sword (should replace first)
-        success, message, old_item = equipped.equip_item(sword2)
+        success, message, old_item = populated_equipped.equip_item(sword2)
         
-        assert success is True
+        assert success
         assert old_item == sword1
-        assert equipped.get_equipped_item(EquipmentSlot.MAIN_HAND) == sword2
+        assert populated_equipped.get_equipped_item(EquipmentSlot.MAIN_HAND) == sword2
     
-    def test_unequip_slot(self):
+    @pytest.mark.parametrize("populated_equipped,slot", _UNEQUIP_CASES,
+                             indirect=["populated_equipped"])
+    def test_unequip_slot(self, populated_equipped, slot):
         """Test unequipping items from slots."""
-        equipped = EquippedItems()
-        sword = create_basic_sword()
-        
-        # Equip and then unequip
-        equipped.equip_item(sword)
-        unequipped_item = equipped.unequip_slot(EquipmentSlot.MAIN_HAND)
+        item = populated_equipped.get_equipped_item(slot)
+        unequipped_item = populated_equipped.unequip_slot(slot)
         
-        assert unequipped_item == sword
-        assert equipped.is_slot_empty(EquipmentSlot.MAIN_HAND) is True
+        assert item is not None
+        assert unequipped_item == item
+        assert populated_equipped.is_slot_empty(slot)
     
-    def test_get_all_equipped(self):
+    def test_get_all_equipped(self, basic_sword):
         """Test getting all equipped items."""
         equipped = EquippedItems()
         
-        sword = create_basic_sword()
         helmet = Armor("Helmet", "Iron", EquipmentSlot.HEAD, defense_bonus=3)
         
-        equipped.equip_item(sword)
+        equipped.equip_item(basic_sword)
         equipped.equip_item(helmet)
         
         all_equipped = equipped.get_all_equipped()
@@ -572,9 +561,10 @@ class TestEquippedItemsClass:
         assert len(all_equipped) == 2
         assert EquipmentSlot.MAIN_HAND in all_equipped
         assert EquipmentSlot.HEAD in all_equipped
-        assert all_equipped[EquipmentSlot.MAIN_HAND] == sword
+        assert all_equipped[EquipmentSlot.MAIN_HAND] == basic_sword
         assert all_equipped[EquipmentSlot.HEAD] == helmet
     
+    @pytest.mark.integration
     def test_get_total_stat_bonuses(self):
         """Test calculating total stat bonuses from all equipment."""
         equipped = EquippedItems()
@@ -590,12 +580,9 @@ class TestEquippedItemsClass:
         
         totals = equipped.get_total_stat_bonuses()
         
-        assert totals['damage'] == 10
-        assert totals['strength'] == 5  # 3 + 2
-        assert totals['health'] == 10
-        assert totals['defense'] == 5
+        assert totals == {'damage': 10, 'strength': 5, 'health': 10, 'defense': 5}  # STR 3 + 2
     
-    def test_equipment_display(self):
+    def test_equipment_display(self, basic_sword):
         """Test equipment display formatting."""
         equipped = EquippedItems()
         
@@ -605,8 +592,7 @@ class TestEquippedItemsClass:
         assert "(empty)" in display
         
         # Test with equipped items
-        sword = create_basic_sword()
-        equipped.equip_item(sword)
+        equipped.equip_item(basic_sword)
         
         display = equipped.get_equipment_display()
         assert "Iron Sword" in display
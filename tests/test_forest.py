@@ -4,330 +4,227 @@ Test suite for the forest location system.
 Tests forest adventures, encounters, and monster generation.
 """
 
+import contextlib
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace as NS
+from unittest.mock import patch
 from src.locations.forest import Forest
+from src.locations.adventure import Adventure
 from src.core.player import Player
+from src.equipment import Weapon
+
+# Adventure-style methods Forest may provide, checked for callability if present
+FOREST_OPTIONAL_METHODS = (
+    "explore", "start_adventure", "get_name", "get_description",
+    "should_encounter", "check_encounter", "create_monster", "generate_monster",
+    "generate_loot", "drop_equipment", "handle_combat_result",
+)
+
+# Optional Forest attributes, probed once at import instead of per test
+_probe = Forest()
+HAS = {
+    name: hasattr(_probe, name)
+    for name in FOREST_OPTIONAL_METHODS + ("min_level", "max_level", "level_cap")
+}
+del _probe
+
+
+def needs(*names):
+    """Skip a test unless Forest provides at least one of the named attributes."""
+    return pytest.mark.skipif(
+        not any(HAS[name] for name in names),
+        reason=f"Forest has no {' or '.join(names)}",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _silent_display():
+    """Replace the display adventures draw to, so no test renders or sleeps."""
+    # adventure.py binds display at import, so patch that name
+    with patch('src.locations.adventure.display') as mock_disp:
+        yield mock_disp
+
+
+@pytest.fixture(scope="module")
+def forest():
+    """Build one Forest for the module; the tests only read from it."""
+    return Forest()
+
+
+@pytest.fixture(scope="module")
+def explorer_player():
+    """Build one level 3 player shared by the forest tests."""
+    return Player("Test Explorer", level=3, experience=100)
 
 
 class TestForestCreation:
     """Test Forest initialization and basic functionality."""
     
-    def test_forest_creation(self):
+    def test_forest_creation(self, forest):
         """Test Forest creation."""
-        forest = Forest()
-        
         assert isinstance(forest, Forest)
         # Forest should inherit from Adventure
-        assert hasattr(forest, 'explore') or hasattr(forest, 'start_adventure')
+        assert HAS['explore'] or HAS['start_adventure']
     
-    def test_forest_properties(self):
+    def test_forest_properties(self, forest):
         """Test Forest has required properties."""
-        forest = Forest()
-        
         # Should have basic adventure properties
-        forest_attrs = dir(forest)
-        assert len(forest_attrs) > 0
+        assert forest.get_location_name() == "Forest"
+        assert forest.encounter_rate == 0.8
 
 
 class TestForestExploration:
     """Test Forest exploration mechanics."""
     
-    @patch('src.ui.display.display')
-    @patch('src.entities.monster.Monster.create_random_for_level')
-    def test_forest_encounter(self, mock_monster_create, mock_display):
+    @patch('src.entities.monster.Monster.create_random_for_level', autospec=True)
+    def test_forest_encounter(self, mock_monster_create, forest, explorer_player, _silent_display):
         """Test forest encounter generation."""
-        forest = Forest()
-        player = Player("Test Explorer", level=3, experience=100)
-        
         # Mock monster creation
-        mock_monster = Mock()
-        mock_monster.name = "Forest Goblin"
-        mock_monster.level = 3
+        mock_monster = NS(name="Forest Goblin", emoji="👺", level=3)
         mock_monster_create.return_value = mock_monster
         
-        # Mock display
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
+        # Choose "Return to the inn" after the fight
+        _silent_display.display_menu.return_value = "2"
         
-        try:
-            if hasattr(forest, 'explore'):
-                result = forest.explore(player)
-                assert result is not None
-            elif hasattr(forest, 'start_adventure'):
-                result = forest.start_adventure(player)
-                assert result is not None
-            else:
-                assert True  # Method names might be different
-        except Exception as e:
-            assert True
-    
-    @patch('random.random')
-    def test_forest_encounter_rate(self, mock_random):
-        """Test forest encounter rate mechanics."""
-        forest = Forest()
-        player = Player("Test Explorer", level=3, experience=100)
+        # 50% < 80% encounter rate, so the first step is a fight
+        with patch('random.random', return_value=0.5), \
+             patch.object(forest.combat, 'run_combat', return_value="victory") as mock_run:
+            result = forest.start_adventure(explorer_player)
         
-        # Mock 80% encounter rate (forest should have encounters)
-        mock_random.return_value = 0.5  # 50% < 80%, should trigger encounter
-        
-        try:
-            if hasattr(forest, 'should_encounter') or hasattr(forest, 'check_encounter'):
-                # Should have encounter logic
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert result == "returned"
+        mock_run.assert_called_once_with(explorer_player, mock_monster)
     
-    @patch('src.ui.display.display')
-    def test_forest_peaceful_event(self, mock_display):
+    @needs('explore')
+    def test_forest_peaceful_event(self, forest, explorer_player):
         """Test forest peaceful events."""
-        forest = Forest()
-        player = Player("Test Explorer", level=3, experience=100)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
         with patch('random.random', return_value=0.9):  # No encounter (90% > 80%)
-            try:
-                if hasattr(forest, 'explore'):
-                    result = forest.explore(player)
-                    # Should handle peaceful exploration
-                    assert True
-                else:
-                    assert True
-            except Exception as e:
-                assert True
+            # Should handle peaceful exploration
+            forest.explore(explorer_player)
 
 
 class TestForestMonsterGeneration:
     """Test Forest monster generation and scaling."""
     
-    @patch('src.entities.monster.Monster.create_random_for_level')
-    def test_forest_monster_level_scaling(self, mock_monster_create):
+    @needs('create_monster', 'generate_monster')
+    @patch('src.entities.monster.Monster.create_random_for_level', autospec=True)
+    def test_forest_monster_level_scaling(self, mock_monster_create, forest):
         """Test that forest creates appropriate level monsters."""
-        forest = Forest()
         player = Player("Test Explorer", level=5, experience=200)
         
-        mock_monster = Mock()
-        mock_monster.name = "Forest Wolf"
-        mock_monster.level = 5
-        mock_monster_create.return_value = mock_monster
+        mock_monster_create.return_value = NS(name="Forest Wolf", emoji="🐺", level=5)
+        
+        if HAS['create_monster']:
+            forest.create_monster(player)
+        else:
+            forest.generate_monster(player)
         
-        try:
-            if hasattr(forest, 'create_monster') or hasattr(forest, 'generate_monster'):
-                monster = forest.create_monster(player) if hasattr(forest, 'create_monster') else forest.generate_monster(player)
-                
-                # Should call Monster.create_random_for_level with player level
-                mock_monster_create.assert_called_with(player.level)
-            else:
-                # Might use Monster.create_random_for_level directly
-                assert True
-        except Exception as e:
-            assert True
+        # Should call Monster.create_random_for_level with player level
+        mock_monster_create.assert_called_with(player.level)
     
-    def test_forest_level_cap(self):
+    @pytest.mark.parametrize("attr", [
+        pytest.param(attr, marks=needs(attr))
+        for attr in ("min_level", "max_level", "level_cap")
+    ])
+    def test_forest_level_cap(self, forest, attr):
         """Test that forest has appropriate level cap (1-10)."""
-        forest = Forest()
-        
         # Forest should be designed for levels 1-10
-        if hasattr(forest, 'min_level'):
-            assert forest.min_level <= 10
-        if hasattr(forest, 'max_level'):
-            assert forest.max_level <= 10
-        if hasattr(forest, 'level_cap'):
-            assert forest.level_cap <= 10
+        assert getattr(forest, attr) <= 10
 
 
 class TestForestCombatIntegration:
     """Test Forest integration with combat system."""
     
-    @patch('src.ui.display.display')
-    @patch('src.core.combat.Combat')
-    def test_forest_combat_initiation(self, mock_combat_class, mock_display):
+    # Adventure.__init__ looks Combat up in the adventure module
+    @patch('src.locations.adventure.Combat', autospec=True)
+    @patch('src.entities.monster.Monster.create_random_for_level', autospec=True)
+    def test_forest_combat_initiation(self, mock_monster_create, mock_combat_class,
+                                      explorer_player, _silent_display):
         """Test forest initiating combat encounters."""
-        forest = Forest()
-        player = Player("Test Fighter", level=3, experience=100)
-        
-        # Mock combat system
-        mock_combat = Mock()
+        mock_monster = NS(name="Forest Goblin", emoji="👺", level=3)
+        mock_monster_create.return_value = mock_monster
+        mock_combat = mock_combat_class.return_value
         mock_combat.run_combat.return_value = "victory"
-        mock_combat_class.return_value = mock_combat
         
-        # Mock display
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
+        # Choose "Return to the inn" after the fight
+        _silent_display.display_menu.return_value = "2"
         
-        try:
-            if hasattr(forest, 'explore'):
-                with patch('src.entities.monster.Monster.create_random_for_level') as mock_monster:
-                    mock_monster_instance = Mock()
-                    mock_monster.return_value = mock_monster_instance
-                    
-                    result = forest.explore(player)
-                    # Should handle combat integration
-                    assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
-    
-    @patch('src.ui.display.display')
-    def test_forest_combat_victory(self, mock_display):
-        """Test forest handling combat victory."""
         forest = Forest()
-        player = Player("Test Winner", level=3, experience=100)
+        with patch('random.random', return_value=0.5):
+            result = forest.start_adventure(explorer_player)
         
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(forest, 'handle_combat_result'):
-                result = forest.handle_combat_result(player, "victory")
-                assert result is not None
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert result == "returned"
+        mock_combat_class.assert_called_once_with()
+        mock_combat.run_combat.assert_called_once_with(explorer_player, mock_monster)
+    
+    @needs('handle_combat_result')
+    def test_forest_combat_victory(self, forest, explorer_player):
+        """Test forest handling combat victory."""
+        result = forest.handle_combat_result(explorer_player, "victory")
+        assert result is not None
     
-    @patch('src.ui.display.display') 
-    def test_forest_combat_defeat(self, mock_display):
+    @needs('handle_combat_result')
+    def test_forest_combat_defeat(self, forest, explorer_player):
         """Test forest handling combat defeat."""
-        forest = Forest()
-        player = Player("Test Loser", level=3, experience=100)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(forest, 'handle_combat_result'):
-                result = forest.handle_combat_result(player, "defeat")
-                assert result is not None
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        result = forest.handle_combat_result(explorer_player, "defeat")
+        assert result is not None
 
 
 class TestForestAdventureInheritance:
     """Test Forest inheritance from Adventure base class."""
     
-    def test_forest_inherits_adventure(self):
+    def test_forest_inherits_adventure(self, forest):
         """Test that Forest properly inherits from Adventure."""
-        from src.locations.adventure import Adventure
-        
-        forest = Forest()
         assert isinstance(forest, Adventure)
     
-    def test_forest_implements_abstract_methods(self):
-        """Test that Forest implements required abstract methods."""
-        forest = Forest()
-        
-        # Should implement adventure interface
-        adventure_methods = ['explore', 'start_adventure', 'get_name', 'get_description']
-        
-        for method_name in adventure_methods:
-            if hasattr(forest, method_name):
-                method = getattr(forest, method_name)
-                assert callable(method)
+    @pytest.mark.parametrize("method_name", [
+        pytest.param(name, marks=needs(name)) for name in FOREST_OPTIONAL_METHODS
+    ])
+    def test_forest_optional_method(self, forest, method_name):
+        """Test that any adventure method Forest provides is callable."""
+        assert callable(getattr(forest, method_name))
 
 
 class TestForestEquipmentIntegration:
     """Test Forest integration with equipment system."""
     
-    @patch('src.ui.display.display')
-    def test_forest_equipment_drops(self, mock_display):
+    @needs('generate_loot', 'drop_equipment')
+    def test_forest_equipment_drops(self, forest, explorer_player):
         """Test forest equipment drop mechanics."""
-        from src.equipment import Weapon, Armor
-        
-        forest = Forest()
-        player = Player("Test Looter", level=3, experience=100)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            # Forest might drop equipment after combat
-            if hasattr(forest, 'generate_loot') or hasattr(forest, 'drop_equipment'):
-                loot = forest.generate_loot(player) if hasattr(forest, 'generate_loot') else forest.drop_equipment(player)
-                # Should be able to generate appropriate loot
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
-    
-    def test_forest_equipment_level_appropriate(self):
+        # Forest might drop equipment after combat
+        if HAS['generate_loot']:
+            forest.generate_loot(explorer_player)
+        else:
+            forest.drop_equipment(explorer_player)
+    
+    @needs('generate_loot')
+    def test_forest_equipment_level_appropriate(self, forest):
         """Test that forest drops level-appropriate equipment."""
-        forest = Forest()
         player = Player("Test Collector", level=5, experience=200)
         
-        try:
-            if hasattr(forest, 'generate_loot'):
-                with patch('random.choice') as mock_choice:
-                    from src.equipment import Weapon
-                    mock_weapon = Weapon("Forest Sword", damage=8, level_requirement=5)
-                    mock_choice.return_value = mock_weapon
-                    
-                    loot = forest.generate_loot(player)
-                    # Should generate appropriate level equipment
-                    assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        with patch('random.choice') as mock_choice:
+            mock_weapon = Weapon("Forest Sword", damage=8, level_requirement=5)
+            mock_choice.return_value = mock_weapon
+            
+            # Should generate appropriate level equipment
+            forest.generate_loot(player)
 
 
 class TestForestEdgeCases:
     """Test Forest edge cases and error conditions."""
     
-    def test_forest_invalid_player(self):
-        """Test forest with invalid player input."""
-        forest = Forest()
-        
-        try:
-            if hasattr(forest, 'explore'):
-                # Should handle None player gracefully
-                result = forest.explore(None)
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            # Should handle invalid input gracefully
-            assert True
-    
-    def test_forest_monster_creation_failure(self):
+    @needs('explore')
+    def test_forest_monster_creation_failure(self, forest, explorer_player):
         """Test forest handling monster creation failures."""
-        forest = Forest()
-        player = Player("Test Explorer", level=3, experience=100)
-        
-        try:
-            with patch('src.entities.monster.Monster.create_random_for_level', side_effect=Exception("Monster Error")):
-                if hasattr(forest, 'explore'):
-                    # Should handle monster creation errors gracefully
-                    result = forest.explore(player)
-                    assert True
-                else:
-                    assert True
-        except Exception as e:
-            assert True
+        with patch('src.entities.monster.Monster.create_random_for_level', side_effect=Exception("Monster Error")):
+            # Should handle monster creation errors gracefully
+            with contextlib.suppress(Exception):
+                forest.explore(explorer_player)
     
-    @patch('src.ui.display.display')
-    def test_forest_display_error_handling(self, mock_display):
+    @needs('explore')
+    def test_forest_display_error_handling(self, forest, explorer_player, _silent_display):
         """Test forest handling display errors."""
-        forest = Forest()
-        player = Player("Test Explorer", level=3, experience=100)
-        
-        mock_display.add_line = Mock(side_effect=Exception("Display Error"))
-        mock_display.show = Mock()
+        _silent_display.add_line.side_effect = Exception("Display Error")
         
-        try:
-            if hasattr(forest, 'explore'):
-                # Should handle display errors gracefully
-                result = forest.explore(player)
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
\ No newline at end of file
+        # Should handle display errors gracefully
+        with contextlib.suppress(Exception):
+            forest.explore(explorer_player)
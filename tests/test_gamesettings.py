@@ -5,27 +5,25 @@ Tests configuration management, settings persistence, and validation.
 """
 
 import pytest
-from unittest.mock import Mock, patch
-import tempfile
+from unittest.mock import mock_open, patch
 import os
 from src.config.gamesettings import GameSettings
 
+# Canned settings file contents for the load tests
+SETTINGS_JSON = '{"auto_save": true, "text_speed": 0.5}'
+
 
 class TestGameSettingsCreation:
     """Test GameSettings initialization and basic functionality."""
     
-    def test_gamesettings_creation(self):
+    def test_gamesettings_creation(self, settings):
         """Test GameSettings creation with default values."""
-        settings = GameSettings()
-        
         assert hasattr(settings, 'auto_save')
         assert hasattr(settings, 'text_speed') 
         assert hasattr(settings, 'debug_mode')
         
-    def test_gamesettings_default_values(self):
+    def test_gamesettings_default_values(self, settings):
         """Test that GameSettings has reasonable default values."""
-        settings = GameSettings()
-        
         # Check default values exist and are reasonable
         assert isinstance(settings.auto_save, bool)
         assert isinstance(settings.text_speed, (int, float))
@@ -35,26 +33,16 @@ class TestGameSettingsCreation:
 class TestSettingsPersistence:
     """Test settings save and load functionality."""
     
-    @patch('src.config.gamesettings.os.path.exists')
-    @patch('src.config.gamesettings.open')
-    def test_load_settings_file_exists(self, mock_open, mock_exists):
+    @patch('src.config.gamesettings.os.path.exists', return_value=True)
+    @patch('src.config.gamesettings.open', mock_open(read_data=SETTINGS_JSON))
+    def test_load_settings_file_exists(self, mock_exists):
         """Test loading settings when file exists."""
-        mock_exists.return_value = True
-        mock_file = Mock()
-        mock_file.read.return_value = '{"auto_save": true, "text_speed": 0.5}'
-        mock_open.return_value.__enter__.return_value = mock_file
-        
         settings = GameSettings()
-        try:
-            settings.load_settings()
-            # Should not raise an exception
-            assert True
-        except Exception as e:
-            # If method doesn't exist, that's fine for now
-            if "has no attribute" in str(e):
-                assert True
-            else:
-                raise
+        settings.load_settings()
+        
+        # Values from the file replace the defaults
+        assert settings.auto_save is True
+        assert settings.text_speed == 0.5
     
     @patch('src.config.gamesettings.os.path.exists')
     def test_load_settings_file_not_exists(self, mock_exists):
@@ -62,159 +50,80 @@ class TestSettingsPersistence:
         mock_exists.return_value = False
         
         settings = GameSettings()
-        try:
-            settings.load_settings()
-            # Should handle missing file gracefully
-            assert True
-        except Exception as e:
-            if "has no attribute" in str(e):
-                assert True
-            else:
-                raise
+        settings.load_settings()
+        
+        # Should keep the defaults when there is no file
+        assert settings.auto_save is True
+        assert settings.text_speed == 0.3
     
-    def test_save_settings(self):
+    def test_save_settings(self, settings, settings_dir):
         """Test saving settings to file."""
-        settings = GameSettings()
+        settings.save_settings()
         
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                settings.save_settings()
-                # Should not raise an exception
-                assert True
-        except Exception as e:
-            if "has no attribute" in str(e):
-                # Method might not be implemented yet
-                assert True
-            else:
-                raise
+        assert (settings_dir / "config" / "settings.json").exists()
 
 
 class TestSettingsValidation:
     """Test settings validation and error handling."""
     
-    def test_invalid_settings_handling(self):
+    @patch('src.config.gamesettings.os.path.exists', return_value=True)
+    @patch('src.config.gamesettings.open', mock_open(read_data='{"text_speed": 5}'))
+    def test_invalid_settings_handling(self, mock_exists, settings):
         """Test handling of invalid setting values."""
-        settings = GameSettings()
+        settings.load_settings()
         
-        # Test that settings object can handle various inputs
-        try:
-            # Try to set various properties if they exist
-            if hasattr(settings, 'text_speed'):
-                # Should handle reasonable values
-                assert True
-        except Exception:
-            # If validation exists, it should handle errors gracefully
-            assert True
+        # Out of range text speed is clamped to the 0.1 - 1.0 range
+        assert settings.text_speed == 1.0
     
-    def test_settings_boundaries(self):
+    def test_settings_boundaries(self, settings):
         """Test settings boundary validation."""
-        settings = GameSettings()
+        # Text speed should be reasonable
+        assert 0 <= settings.text_speed <= 10
         
-        # Test reasonable boundary conditions
-        if hasattr(settings, 'text_speed'):
-            # Text speed should be reasonable
-            assert settings.text_speed >= 0
-            
-        if hasattr(settings, 'auto_save'):
-            # Auto save should be boolean
-            assert isinstance(settings.auto_save, bool)
+        # Auto save should be boolean
+        assert isinstance(settings.auto_save, bool)
 
 
 class TestSettingsIntegration:
     """Test settings integration with game systems."""
     
-    def test_debug_mode_integration(self):
-        """Test debug mode setting integration."""
-        settings = GameSettings()
-        
-        if hasattr(settings, 'debug_mode'):
-            # Debug mode should be boolean
-            assert isinstance(settings.debug_mode, bool)
-            
-            # Should be able to toggle debug mode
-            original_debug = settings.debug_mode
-            try:
-                settings.debug_mode = not original_debug
-                assert settings.debug_mode != original_debug
-            except AttributeError:
-                # Property might be read-only
-                assert True
+    @pytest.mark.parametrize("attr,expected_type", [
+        ("debug_mode", bool),
+        ("text_speed", (int, float)),
+        ("auto_save", bool),
+    ])
+    def test_settings_attr_type(self, settings, attr, expected_type):
+        """Test each setting holds the type the game systems expect."""
+        assert isinstance(getattr(settings, attr), expected_type)
     
-    def test_text_speed_integration(self):
-        """Test text speed setting integration."""
-        settings = GameSettings()
-        
-        if hasattr(settings, 'text_speed'):
-            # Text speed should be numeric
-            assert isinstance(settings.text_speed, (int, float))
-            
-            # Should be within reasonable bounds
-            assert 0 <= settings.text_speed <= 10
-    
-    def test_auto_save_integration(self):
-        """Test auto save setting integration."""
-        settings = GameSettings()
-        
-        if hasattr(settings, 'auto_save'):
-            # Auto save should be boolean
-            assert isinstance(settings.auto_save, bool)
+    def test_debug_mode_toggle(self, settings):
+        """Test debug mode setting can be toggled."""
+        original_debug = settings.debug_mode
+        settings.debug_mode = not original_debug
+        assert settings.debug_mode != original_debug
 
 
 class TestSettingsEdgeCases:
     """Test edge cases and error conditions."""
     
-    def test_corrupted_settings_file(self):
+    @patch('src.config.gamesettings.os.path.exists', return_value=True)
+    def test_corrupted_settings_file(self, mock_exists, settings):
         """Test handling of corrupted settings file."""
-        settings = GameSettings()
-        
-        with patch('src.config.gamesettings.open') as mock_open:
-            mock_file = Mock()
-            mock_file.read.return_value = 'invalid json {'
-            mock_open.return_value.__enter__.return_value = mock_file
-            
-            try:
-                if hasattr(settings, 'load_settings'):
-                    settings.load_settings()
-                # Should handle corrupted files gracefully
-                assert True
-            except Exception as e:
-                # Should not crash on corrupted files
-                if "JSON" in str(e) or "json" in str(e):
-                    assert True  # Expected JSON error
-                else:
-                    raise
+        with patch('src.config.gamesettings.open', mock_open(read_data='invalid json {')):
+            # Should handle corrupted files gracefully, keeping current values
+            original_speed = settings.text_speed
+            settings.load_settings()
+            assert settings.text_speed == original_speed
     
-    def test_readonly_settings_file(self):
+    def test_readonly_settings_file(self, settings, settings_dir):
         """Test handling of read-only settings file."""
-        settings = GameSettings()
-        
         with patch('src.config.gamesettings.open', side_effect=PermissionError):
-            try:
-                if hasattr(settings, 'save_settings'):
-                    settings.save_settings()
-                # Should handle permission errors gracefully
-                assert True
-            except PermissionError:
-                # Expected behavior for read-only files
-                assert True
-            except Exception as e:
-                if "has no attribute" in str(e):
-                    assert True
-                else:
-                    raise
+            # Should handle permission errors gracefully
+            settings.save_settings()
     
-    def test_missing_config_directory(self):
+    def test_missing_config_directory(self, settings, settings_dir):
         """Test handling when config directory doesn't exist."""
-        settings = GameSettings()
+        settings.save_settings()
         
-        # Should handle missing directories gracefully
-        try:
-            if hasattr(settings, 'save_settings'):
-                settings.save_settings()
-            assert True
-        except Exception as e:
-            if "has no attribute" in str(e):
-                assert True
-            else:
-                # Should create directory or handle error gracefully
-                assert True
\ No newline at end of file
+        # Should create the missing config directory
+        assert (settings_dir / "config").is_dir()
@@ -5,9 +5,38 @@ Tests inn services, menu interactions, and player interactions.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 from src.locations.inn import Inn
-from src.core.player import Player
+
+
+def _noop(*args, **kwargs):
+    """Stand in for display calls whose output no test inspects."""
+
+
+@pytest.fixture(autouse=True)
+def stub_display(monkeypatch):
+    """Replace the display the inn draws to, choosing to leave by default."""
+    # Only the calls inn.py makes; no test reads a call log, so no Mock needed
+    stub = SimpleNamespace(
+        menu_choice="6",
+        clear_hp_header=_noop,
+        display_stats=_noop,
+        display_text=_noop,
+    )
+    stub.display_menu = lambda *args, **kwargs: stub.menu_choice
+    monkeypatch.setattr("src.locations.inn.display", stub)
+    # Saving reports through the player module's own display binding
+    monkeypatch.setattr("src.core.player.display", SimpleNamespace(add_line=_noop))
+    return stub
+
+
+@pytest.fixture
+def auto_saves(monkeypatch, hero):
+    """Record the hero's auto-save contexts instead of touching the database."""
+    contexts = []
+    monkeypatch.setattr(hero, "auto_save", lambda context="general": contexts.append(context))
+    return contexts
 
 
 class TestInnCreation:
@@ -18,304 +47,95 @@ class TestInnCreation:
         inn = Inn()
         
         assert isinstance(inn, Inn)
-        assert hasattr(inn, 'name') or hasattr(inn, 'description')
-    
-    def test_inn_basic_properties(self):
-        """Test Inn has basic properties."""
-        inn = Inn()
-        
-        # Inn should have identifiable properties
-        inn_attrs = dir(inn)
-        assert len(inn_attrs) > 0
-
-
-class TestInnServices:
-    """Test Inn service functionality."""
-    
-    @patch('src.ui.display.display')
-    def test_inn_rest_service(self, mock_display):
-        """Test inn rest functionality."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
-        
-        # Mock display interactions
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        # Test rest service if it exists
-        try:
-            if hasattr(inn, 'rest'):
-                result = inn.rest(player)
-                # Should return some indication of success
-                assert result is not None
-            else:
-                # Method might not exist yet
-                assert True
-        except Exception as e:
-            # Should handle errors gracefully
-            assert True
-    
-    @patch('src.ui.display.display')  
-    def test_inn_save_service(self, mock_display):
-        """Test inn save functionality."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'save_game'):
-                result = inn.save_game(player)
-                assert result is not None
-            else:
-                assert True
-        except Exception as e:
-            assert True
-    
-    @patch('src.ui.display.display')
-    def test_inn_equipment_service(self, mock_display):
-        """Test inn equipment management."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'manage_equipment') or hasattr(inn, 'equipment_menu'):
-                # Test equipment management exists
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert inn.current_location == "inn"
 
 
-class TestInnMenuSystem:
-    """Test Inn menu and navigation."""
+class TestInnMenu:
+    """Test Inn menu choices."""
     
-    @patch('src.ui.display.display')
-    def test_inn_main_menu(self, mock_display):
-        """Test inn main menu display."""
-        inn = Inn()
-        
-        mock_display.display_menu = Mock(return_value="1")
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'show_menu') or hasattr(inn, 'main_menu'):
-                # Menu should exist
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+    @pytest.mark.parametrize("choice,expected", [
+        ("6", "quit"),         # Quit game
+        ("quit", "quit"),      # Typed quit command
+        ("3", "continue"),     # View stats
+        ("invalid", "continue"),
+    ])
+    def test_inn_menu_result(self, stub_display, hero, auto_saves, choice, expected):
+        """Test that each menu choice keeps the player at the inn or quits."""
+        stub_display.menu_choice = choice
+        
+        assert Inn().show_inn_menu(hero) == expected
     
-    @patch('src.ui.display.display')
-    def test_inn_menu_navigation(self, mock_display):
-        """Test inn menu navigation."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+    def test_inn_quit_saves(self, stub_display, hero, auto_saves):
+        """Test that quitting from the menu saves first."""
+        stub_display.menu_choice = "6"
         
-        mock_display.display_menu = Mock(return_value="6")  # Quit option
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
+        Inn().show_inn_menu(hero)
         
-        try:
-            if hasattr(inn, 'visit') or hasattr(inn, 'enter'):
-                result = inn.visit(player) if hasattr(inn, 'visit') else inn.enter(player)
-                # Should handle menu navigation
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert auto_saves == ["general"]
 
 
 class TestInnPlayerInteractions:
     """Test Inn interactions with player."""
     
-    def test_inn_player_rest_healing(self):
+    @pytest.mark.parametrize("damage_ratio", [0.5, 0.25, 0.1])
+    def test_inn_player_rest_healing(self, stub_display, hero, auto_saves, damage_ratio):
         """Test that resting at inn heals player."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+        stub_display.menu_choice = "1"
         
         # Damage player
-        original_health = player.current_health
-        player.current_health = player.current_health // 2
-        damaged_health = player.current_health
+        hero.current_health = max(1, int(hero.max_health * damage_ratio))
         
-        try:
-            if hasattr(inn, 'rest'):
-                with patch('src.ui.display.display') as mock_display:
-                    mock_display.add_line = Mock()
-                    mock_display.show = Mock()
-                    
-                    inn.rest(player)
-                    
-                    # Player should be healed
-                    assert player.current_health >= damaged_health
-            else:
-                assert True
-        except Exception as e:
-            assert True
-    
-    def test_inn_player_save_persistence(self):
-        """Test that saving at inn persists player data."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+        assert Inn().show_inn_menu(hero) == "continue"
         
-        try:
-            if hasattr(inn, 'save_game'):
-                with patch('src.core.gamedata.game_db') as mock_db:
-                    mock_db.save_player = Mock()
-                    
-                    inn.save_game(player)
-                    
-                    # Should attempt to save player
-                    assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
-
-
-class TestInnEquipmentIntegration:
-    """Test Inn integration with equipment system."""
+        # Player should be healed and the rest auto-saved
+        assert hero.current_health == hero.max_health
+        assert auto_saves == ["rest"]
     
-    @patch('src.ui.display.display')
-    def test_inn_inventory_access(self, mock_display):
-        """Test accessing player inventory at inn."""
-        from src.equipment import Inventory, EquippedItems
-        
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+    def test_inn_rest_at_full_health(self, stub_display, hero, auto_saves):
+        """Test that resting at full health neither heals nor saves."""
+        stub_display.menu_choice = "1"
         
-        # Give player equipment system
-        player.inventory = Inventory(max_capacity=20)
-        player.equipped = EquippedItems()
+        Inn().show_inn_menu(hero)
         
-        mock_display.display_menu = Mock(return_value="6")
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'manage_equipment') or hasattr(inn, 'inventory_menu'):
-                # Should be able to access equipment
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert hero.current_health == hero.max_health
+        assert auto_saves == []
     
-    @patch('src.ui.display.display')
-    def test_inn_equipment_display(self, mock_display):
-        """Test displaying equipment at inn."""
-        from src.equipment import EquippedItems, Weapon
-        
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
-        player.equipped = EquippedItems()
-        
-        # Equip some items
-        sword = Weapon("Test Sword", damage=5)
-        player.equipped.equip_item(sword)
-        
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'show_equipment') or hasattr(inn, 'equipment_display'):
-                # Should display equipped items
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
-
-
-class TestInnDebugIntegration:
-    """Test Inn integration with debug system."""
+    def test_rest_at_inn_full_health(self, hero):
+        """Test that rest_at_inn declines when the player is already healthy."""
+        assert Inn().rest_at_inn(hero) is False
     
-    @patch('src.ui.display.display')
-    def test_inn_debug_access(self, mock_display):
-        """Test accessing debug menu from inn."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+    @pytest.mark.xfail(raises=NameError, strict=True,
+                       reason="rest_at_inn reports an undefined 'healed' variable")
+    def test_rest_at_inn_heals(self, hero):
+        """Test that rest_at_inn restores a damaged player."""
+        hero.current_health = 1
         
-        mock_display.display_menu = Mock(return_value="debug")
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
+        Inn().rest_at_inn(hero)
         
-        try:
-            if hasattr(inn, 'visit') or hasattr(inn, 'main_menu'):
-                # Should handle debug input
-                with patch('src.debug.debug_menu.DebugMenu') as mock_debug:
-                    mock_debug_instance = Mock()
-                    mock_debug.return_value = mock_debug_instance
-                    mock_debug_instance.show_debug_menu = Mock()
-                    
-                    # Test debug access
-                    assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
+        assert hero.current_health == hero.max_health
+    
+    def test_inn_player_save_persistence(self, stub_display, hero):
+        """Test that saving at inn persists player data."""
+        stub_display.menu_choice = "4"
+        
+        # Patch the shared game_db's methods in place, so modules that
+        # imported game_db directly see the mocks too
+        with patch('src.core.gamedata.game_db.save_player') as mock_save:
+            Inn().show_inn_menu(hero)
+            
+            # Should save this player
+            mock_save.assert_called_once_with(hero)
 
 
 class TestInnEdgeCases:
     """Test Inn edge cases and error conditions."""
     
-    def test_inn_invalid_player(self):
-        """Test inn with invalid player input."""
-        inn = Inn()
-        
-        try:
-            if hasattr(inn, 'visit'):
-                # Should handle None player gracefully
-                result = inn.visit(None)
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            # Should handle invalid input gracefully
-            assert True
-    
-    @patch('src.ui.display.display')
-    def test_inn_invalid_menu_choice(self, mock_display):
-        """Test inn with invalid menu choices."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
-        
-        mock_display.display_menu = Mock(return_value="invalid")
-        mock_display.add_line = Mock()
-        mock_display.show = Mock()
-        
-        try:
-            if hasattr(inn, 'visit'):
-                # Should handle invalid menu choices
-                result = inn.visit(player)
-                assert True
-            else:
-                assert True
-        except Exception as e:
-            assert True
-    
-    def test_inn_database_error_handling(self):
+    def test_inn_database_error_handling(self, stub_display, hero):
         """Test inn handling database errors."""
-        inn = Inn()
-        player = Player("Test Hero", level=2, experience=50)
+        stub_display.menu_choice = "4"
+        
+        with patch('src.core.gamedata.game_db.save_player', side_effect=Exception("DB Error")) as mock_save:
+            # Should swallow the database error after trying to save
+            assert Inn().show_inn_menu(hero) == "continue"
         
-        try:
-            if hasattr(inn, 'save_game'):
-                with patch('src.core.gamedata.game_db.save_player', side_effect=Exception("DB Error")):
-                    # Should handle database errors gracefully
-                    inn.save_game(player)
-                    assert True
-            else:
-                assert True
-        except Exception as e:
-            # Should not crash on database errors
-            assert True
\ No newline at end of file
+        assert mock_save.called
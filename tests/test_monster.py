@@ -5,38 +5,54 @@ Tests monster classes, level scaling, and database integration.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from collections import Counter
+from unittest.mock import Mock
+from src.core.gamedata import game_db
 from src.entities.monster import Monster
 
 
+@pytest.fixture(scope="module")
+def base_monster():
+    """Build one fully specified monster for the read-only creation test."""
+    return Monster(
+        name="Test Goblin",
+        max_health=25,
+        strength=8,
+        level=3,
+        emoji="👹"
+    )
+
+
+@pytest.fixture(scope="module")
+def default_monster():
+    """Build one monster with default level and emoji; don't mutate it."""
+    return Monster("Simple Goblin", max_health=20, strength=5)
+
+
+@pytest.fixture(scope="module")
+def fallback_monsters():
+    """Build one fallback monster per tested level; don't mutate them."""
+    return {lvl: Monster.create_fallback_monster(lvl) for lvl in (1, 2, 4, 5, 8)}
+
+
 class TestMonsterBaseClass:
     """Test the base Monster class functionality."""
     
-    def test_monster_creation(self):
+    def test_monster_creation(self, base_monster):
         """Test basic monster creation with all parameters."""
-        monster = Monster(
-            name="Test Goblin",
-            max_health=25,
-            strength=8,
-            level=3,
-            emoji="👹"
-        )
-        
-        assert monster.name == "Test Goblin"
-        assert monster.max_health == 25
-        assert monster.current_health == 25
-        assert monster.strength == 8
-        assert monster.level == 3
-        assert monster.is_alive is True
-        assert monster.emoji == "👹"
+        assert base_monster.name == "Test Goblin"
+        assert base_monster.max_health == 25
+        assert base_monster.current_health == 25
+        assert base_monster.strength == 8
+        assert base_monster.level == 3
+        assert base_monster.is_alive is True
+        assert base_monster.emoji == "👹"
     
-    def test_monster_default_values(self):
+    def test_monster_default_values(self, default_monster):
         """Test monster creation with default values."""
-        monster = Monster("Simple Goblin", max_health=20, strength=5)
-        
-        assert monster.level == 1  # Default level
-        assert monster.emoji == "🐾"  # Default emoji
-        assert monster.is_alive is True
+        assert default_monster.level == 1  # Default level
+        assert default_monster.emoji == "🐾"  # Default emoji
+        assert default_monster.is_alive is True
     
     def test_update_health(self):
         """Test updating monster health."""
@@ -84,71 +100,33 @@ class TestMonsterBaseClass:
 class TestMonsterLevelScaling:
     """Test the monster level scaling system."""
     
-    def test_calculate_monster_level_same_level(self):
-        """Test monster level calculation - same as player level."""
-        # Mock random to always return 0.25 (50% chance range)
-        with patch('src.entities.monster.random.random', return_value=0.25):
-            level = Monster._calculate_monster_level(5)
-            assert level == 5  # Same level as player
-    
-    def test_calculate_monster_level_plus_one(self):
-        """Test monster level calculation - player level +1."""
-        # Mock random to return 0.60 (20% chance for +1)
-        with patch('src.entities.monster.random.random', return_value=0.60):
-            level = Monster._calculate_monster_level(5)
-            assert level == 6  # Player level + 1
-    
-    def test_calculate_monster_level_minus_one(self):
-        """Test monster level calculation - player level -1."""
-        # Mock random to return 0.80 (20% chance for -1)
-        with patch('src.entities.monster.random.random', return_value=0.80):
-            level = Monster._calculate_monster_level(5)
-            assert level == 4  # Player level - 1
-    
-    def test_calculate_monster_level_plus_two(self):
-        """Test monster level calculation - player level +2."""
-        # Mock random to return 0.92 (5% chance for +2)
-        with patch('src.entities.monster.random.random', return_value=0.92):
-            level = Monster._calculate_monster_level(5)
-            assert level == 7  # Player level + 2
-    
-    def test_calculate_monster_level_minus_two(self):
-        """Test monster level calculation - player level -2."""
-        # Mock random to return 0.97 (5% chance for -2)
-        with patch('src.entities.monster.random.random', return_value=0.97):
-            level = Monster._calculate_monster_level(5)
-            assert level == 3  # Player level - 2
-    
-    def test_calculate_monster_level_cap_at_10(self):
-        """Test that monster level is capped at 10 (forest area max)."""
-        # High level player, +2 modifier
-        with patch('src.entities.monster.random.random', return_value=0.92):
-            level = Monster._calculate_monster_level(15)
-            assert level == 10  # Capped at forest max level
+    @pytest.mark.parametrize("roll,player_level,expected", [
+        (0.25, 5, 5),    # 50% band: same level as player
+        (0.60, 5, 6),    # 20% band: player level +1
+        (0.80, 5, 4),    # 20% band: player level -1
+        (0.92, 5, 7),    # 5% band: player level +2
+        (0.97, 5, 3),    # 5% band: player level -2
+        (0.92, 15, 10),  # +2 is capped at the forest max level
+        (0.97, 1, 1),    # -2 never goes below level 1
+    ])
+    def test_calculate_monster_level(self, monkeypatch, roll, player_level, expected):
+        """Test monster level calculation for each probability band."""
+        monkeypatch.setattr('src.entities.monster.random.random', lambda: roll)
+        assert Monster._calculate_monster_level(player_level) == expected
     
-    def test_calculate_monster_level_minimum_1(self):
-        """Test that monster level has minimum of 1."""
-        # Low level player, -2 modifier
-        with patch('src.entities.monster.random.random', return_value=0.97):
-            level = Monster._calculate_monster_level(1)
-            assert level == 1  # Minimum level is 1
-    
-    def test_calculate_monster_level_distribution(self):
+    def test_calculate_monster_level_distribution(self, monkeypatch):
         """Test the probability distribution over many calculations."""
         # This test checks that the distribution is roughly correct
-        levels = []
         player_level = 5
         
-        # Simulate many level calculations
-        for i in range(1000):
-            with patch('src.entities.monster.random.random', return_value=i/1000):
-                level = Monster._calculate_monster_level(player_level)
-                levels.append(level)
+        # Patch once and feed evenly spaced rolls 0.000, 0.001, ... 0.999
+        rolls = iter([i / 1000 for i in range(1000)])
+        monkeypatch.setattr('src.entities.monster.random.random', lambda: next(rolls))
         
-        # Count occurrences
-        level_counts = {}
-        for level in levels:
-            level_counts[level] = level_counts.get(level, 0) + 1
+        # Simulate many level calculations and count occurrences
+        level_counts = Counter(
+            Monster._calculate_monster_level(player_level) for _ in range(1000)
+        )
         
         # Check that level 5 (same as player) appears most frequently (~50%)
         same_level_count = level_counts.get(5, 0)
@@ -170,12 +148,11 @@ class TestMonsterLevelScaling:
 class TestMonsterCreation:
     """Test monster creation methods."""
     
-    @patch('src.entities.monster.Monster._calculate_monster_level')
-    @patch('src.core.gamedata.game_db.get_random_monster')
-    def test_create_random_for_level_success(self, mock_get_monster, mock_calc_level):
+    def test_create_random_for_level_success(self, monkeypatch):
         """Test successful monster creation from database."""
         # Mock the level calculation
-        mock_calc_level.return_value = 5
+        mock_calc_level = Mock(return_value=5)
+        monkeypatch.setattr(Monster, '_calculate_monster_level', mock_calc_level)
         
         # Mock database response
         mock_monster_data = {
@@ -184,72 +161,58 @@ class TestMonsterCreation:
             'strength': 10,
             'emoji': '👺'
         }
-        mock_get_monster.return_value = mock_monster_data
+        mock_get_monster = Mock(return_value=mock_monster_data)
+        monkeypatch.setattr('src.core.gamedata.game_db.get_random_monster', mock_get_monster)
         
         # Mock create_from_database
-        with patch.object(Monster, 'create_from_database') as mock_create:
-            mock_monster = Monster("Forest Orc", 35, 10, 5, "👺")
-            mock_create.return_value = mock_monster
-            
-            result = Monster.create_random_for_level(3)
-            
-            # Verify the methods were called correctly
-            mock_calc_level.assert_called_once_with(3)
-            mock_get_monster.assert_called_once_with(5)  # Calculated level
-            mock_create.assert_called_once_with(mock_monster_data, 5)
-            
-            assert result == mock_monster
+        mock_monster = Monster("Forest Orc", 35, 10, 5, "👺")
+        mock_create = Mock(return_value=mock_monster)
+        monkeypatch.setattr(Monster, 'create_from_database', mock_create)
+        
+        result = Monster.create_random_for_level(3)
+        
+        # Verify the methods were called correctly
+        mock_calc_level.assert_called_once_with(3)
+        mock_get_monster.assert_called_once_with(5)  # Calculated level
+        mock_create.assert_called_once_with(mock_monster_data, 5)
+        
+        assert result == mock_monster
     
-    @patch('src.entities.monster.Monster._calculate_monster_level')
-    @patch('src.core.gamedata.game_db.get_random_monster')
-    def test_create_random_for_level_database_error(self, mock_get_monster, mock_calc_level):
+    def test_create_random_for_level_database_error(self, monkeypatch):
         """Test fallback when database fails."""
         # Mock the level calculation
-        mock_calc_level.return_value = 3
+        monkeypatch.setattr(Monster, '_calculate_monster_level', lambda player_level: 3)
         
         # Mock database error
-        mock_get_monster.side_effect = Exception("Database connection error")
+        monkeypatch.setattr('src.core.gamedata.game_db.get_random_monster',
+                            Mock(side_effect=Exception("Database connection error")))
         
         # Mock fallback monster creation
-        with patch.object(Monster, 'create_fallback_monster') as mock_fallback:
-            mock_monster = Monster("Goblin", 25, 7, 3, "👹")
-            mock_fallback.return_value = mock_monster
-            
-            result = Monster.create_random_for_level(3)
-            
-            # Verify fallback was used
-            mock_fallback.assert_called_once_with(3)
-            assert result == mock_monster
-    
-    def test_create_fallback_monster_low_level(self):
-        """Test fallback monster creation for low levels."""
-        monster = Monster.create_fallback_monster(2)
+        mock_monster = Monster("Goblin", 25, 7, 3, "👹")
+        mock_fallback = Mock(return_value=mock_monster)
+        monkeypatch.setattr(Monster, 'create_fallback_monster', mock_fallback)
         
-        assert monster.name == "Goblin"
-        assert monster.level == 2
-        assert monster.emoji == "👹"
-        assert monster.max_health > 20  # Should scale with level
-        assert monster.strength > 3  # Should scale with level
-    
-    def test_create_fallback_monster_mid_level(self):
-        """Test fallback monster creation for mid levels."""
-        monster = Monster.create_fallback_monster(4)
+        result = Monster.create_random_for_level(3)
         
-        assert monster.name == "Orc"
-        assert monster.level == 4
-        assert monster.emoji == "👺"
-        assert monster.max_health > 30  # Should scale with level
-        assert monster.strength > 6  # Should scale with level
+        # Verify fallback was used
+        mock_fallback.assert_called_once_with(3)
+        assert result == mock_monster
     
-    def test_create_fallback_monster_high_level(self):
-        """Test fallback monster creation for high levels."""
-        monster = Monster.create_fallback_monster(8)
-        
-        assert monster.name == "Troll"
-        assert monster.level == 8
-        assert monster.emoji == "🧌"
-        assert monster.max_health > 40  # Should scale with level
-        assert monster.strength > 10  # Should scale with level
+    @pytest.mark.parametrize("level,name,emoji,min_health,min_strength", [
+        (2, "Goblin", "👹", 20, 3),   # Low levels
+        (4, "Orc", "👺", 30, 6),      # Mid levels
+        (8, "Troll", "🧌", 40, 10),   # High levels
+    ])
+    def test_create_fallback_monster(self, fallback_monsters, level, name, emoji,
+                                     min_health, min_strength):
+        """Test fallback monster creation for each level band."""
+        monster = fallback_monsters[level]
+        
+        assert monster.name == name
+        assert monster.level == level
+        assert monster.emoji == emoji
+        assert monster.max_health > min_health  # Should scale with level
+        assert monster.strength > min_strength  # Should scale with level
     
     def test_create_from_database_tuple_format(self):
         """Test creating monster from database tuple data (real format)."""
@@ -288,31 +251,27 @@ class TestMonsterCreation:
         assert monster.max_health == 39
         assert monster.strength == 9
     
+    @pytest.mark.integration
+    @pytest.mark.xfail(raises=AttributeError, strict=True,
+                       reason="GameDatabase.get_random_monster reads Monster.DB_RARITY, which is not defined")
     def test_create_from_database_integration(self):
         """Test monster creation with actual database integration."""
-        from src.core.gamedata import game_db
-        
         # This tests the actual database tuple format
-        try:
-            # Get a real monster from the database
-            monster_data = game_db.get_random_monster(player_level=3)
-            
-            if monster_data:  # Only test if database has data
-                monster = Monster.create_from_database(monster_data, player_level=3)
-                
-                # Verify it created a valid monster
-                assert monster.name is not None
-                assert monster.level == 3
-                assert monster.max_health > 0
-                assert monster.strength > 0
-                assert monster.emoji is not None
-                
-                # Verify tuple format is being used correctly
-                assert isinstance(monster_data, tuple)
-                assert len(monster_data) >= 7  # Should have at least 7 fields
-        except Exception:
-            # If database isn't populated, that's fine for now
-            pass
+        monster_data = game_db.get_random_monster(player_level=3)
+        assert monster_data, "monster database has no level 3 monsters"
+        
+        monster = Monster.create_from_database(monster_data, player_level=3)
+        
+        # Verify it created a valid monster
+        assert monster.name is not None
+        assert monster.level == 3
+        assert monster.max_health > 0
+        assert monster.strength > 0
+        assert monster.emoji is not None
+        
+        # Verify tuple format is being used correctly
+        assert isinstance(monster_data, tuple)
+        assert len(monster_data) >= 7  # Should have at least 7 fields
 
 
 class TestMonsterDatabase:
@@ -345,25 +304,31 @@ class TestMonsterIntegration:
         monster.update_health(0)
         assert monster.is_alive is False
     
-    def test_monster_level_scaling_integration(self):
+    def test_monster_level_scaling_integration(self, monkeypatch):
         """Test the complete monster creation with level scaling."""
         player_levels = [1, 5, 10, 15]
         
+        # One roll inside each probability band: same, +1, -1, +2, -2
+        band_rolls = (0.1, 0.55, 0.75, 0.91, 0.96)
+        rolls = iter(band_rolls * len(player_levels))
+        monkeypatch.setattr('src.entities.monster.random.random', lambda: next(rolls))
+        
         for player_level in player_levels:
             # Test level calculation bounds
-            for _ in range(10):  # Test multiple times due to randomness
+            for _ in band_rolls:
                 calculated_level = Monster._calculate_monster_level(player_level)
                 
                 # Should be within ±2 levels of player, but capped at 1-10
-                min_expected = max(1, player_level - 2)
-                max_expected = min(10, player_level + 2)
+                forest_max = 10
+                min_expected = min(max(1, player_level - 2), forest_max)
+                max_expected = min(forest_max, player_level + 2)
                 
                 assert min_expected <= calculated_level <= max_expected
     
-    def test_monster_stats_scaling(self):
+    def test_monster_stats_scaling(self, fallback_monsters):
         """Test that monster stats scale appropriately with level."""
-        low_level = Monster.create_fallback_monster(1)
-        high_level = Monster.create_fallback_monster(5)
+        low_level = fallback_monsters[1]
+        high_level = fallback_monsters[5]
         
         # Higher level monsters should generally be stronger
         assert high_level.max_health >= low_level.max_health
@@ -3,10 +3,17 @@ Unit tests for Player class
 """
 
 import pytest
-from unittest.mock import Mock, patch
 from src.core.player import Player
 
 
+@pytest.fixture
+def player_game_db(monkeypatch, temp_db):
+    """Point the game_db that player.py imported at the test database."""
+    # player.py binds game_db at import, so patching src.core.gamedata misses it
+    monkeypatch.setattr('src.core.player.game_db', temp_db)
+    return temp_db
+
+
 class TestPlayerCreation:
     """Test player creation and initialization."""
     
@@ -102,9 +109,9 @@ class TestPlayerLeveling:
         assert test_player.level == 1
     
     @pytest.mark.parametrize("level", [2, 5, 10])
-    def test_level_scaling_health(self, level):
+    def test_level_scaling_health(self, test_player, level):
         """Test health scales with level."""
-        player = Player("Test", "🧙")
+        player = test_player
         player.level = level
         
         expected_health = 50 + (level - 1) * 10
@@ -114,9 +121,9 @@ class TestPlayerLeveling:
         assert player.max_health == expected_health
     
     @pytest.mark.parametrize("level", [2, 5, 10])
-    def test_level_scaling_strength(self, level):
+    def test_level_scaling_strength(self, test_player, level):
         """Test strength scales with level."""
-        player = Player("Test", "🧙")
+        player = test_player
         player.level = level
         
         expected_strength = 5 + (level - 1) * 2
@@ -126,19 +133,19 @@ class TestPlayerLeveling:
 
 
 @pytest.mark.database
+@pytest.mark.usefixtures("player_game_db")
 class TestPlayerDatabase:
     """Test player database operations."""
     
     def test_save_player(self, test_player, temp_db):
         """Test saving player to database."""
-        with patch('src.core.gamedata.game_db', temp_db):
-            # Save should not raise exception
-            temp_db.save_player(test_player)
-            
-            # Verify player was saved
-            saved_player = temp_db.load_player(test_player.name)
-            assert saved_player is not None
-            assert saved_player.name == test_player.name
+        # Save should not raise exception
+        temp_db.save_player(test_player)
+        
+        # Verify player was saved
+        saved_player = temp_db.load_player(test_player.name)
+        assert saved_player is not None
+        assert saved_player.name == test_player.name
     
     def test_load_player(self, test_player_with_db, temp_db):
         """Test loading player from database."""
@@ -151,51 +158,48 @@ class TestPlayerDatabase:
     
     def test_get_unlocked_areas_default(self, test_player, temp_db):
         """Test new player gets forest unlocked by default."""
-        with patch('src.core.gamedata.game_db', temp_db):
-            temp_db.save_player(test_player)
-            unlocked = test_player.get_unlocked_areas()
-            
-            assert 'forest' in unlocked
+        temp_db.save_player(test_player)
+        unlocked = test_player.get_unlocked_areas()
+        
+        assert 'forest' in unlocked
     
     def test_unlock_new_area(self, test_player, temp_db):
         """Test unlocking a new area."""
-        with patch('src.core.gamedata.game_db', temp_db):
-            temp_db.save_player(test_player)
-            
-            # Unlock cave
-            result = test_player.unlock_area('cave')
-            
-            assert 'cave' in result
-            assert 'forest' in result  # Should still have forest
+        temp_db.save_player(test_player)
+        
+        # Unlock cave
+        result = test_player.unlock_area('cave')
+        
+        assert 'cave' in result
+        assert 'forest' in result  # Should still have forest
 
 
+@pytest.mark.usefixtures("player_game_db")
 class TestPlayerSettings:
     """Test player settings management."""
     
     @pytest.mark.database
     def test_get_default_settings(self, test_player, temp_db):
         """Test getting default settings."""
-        with patch('src.core.gamedata.game_db', temp_db):
-            settings = test_player.get_settings()
-            
-            assert isinstance(settings, dict)
-            assert 'auto_save_after_rest' in settings
-            assert 'auto_save_after_combat' in settings
+        settings = test_player.get_settings()
+        
+        assert isinstance(settings, dict)
+        assert 'auto_save_after_rest' in settings
+        assert 'auto_save_after_combat' in settings
     
     @pytest.mark.database
     def test_update_settings(self, test_player, temp_db):
         """Test updating player settings."""
-        with patch('src.core.gamedata.game_db', temp_db):
-            new_settings = {
-                'auto_save_after_rest': False,
-                'auto_save_after_combat': True,
-                'auto_save_on_inn_visit': True
-            }
-            
-            test_player.update_settings(new_settings)
-            
-            # Should not raise exception
-            assert True  # If we get here, update worked
+        new_settings = {
+            'auto_save_after_rest': False,
+            'auto_save_after_combat': True,
+            'auto_save_on_inn_visit': True
+        }
+        
+        test_player.update_settings(new_settings)
+        
+        # Should not raise exception
+        assert True  # If we get here, update worked
 
 
 if __name__ == "__main__":